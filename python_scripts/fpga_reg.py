@@ -1,3 +1,12 @@
+import sys
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import NamedTuple
+
 #marker_template_start
 #multidata: globaldata:../../pkg/global_templating_data.json
 #multidata: wfg_core_top:../../wfg/wfg_core/data/wfg_core_reg.json
@@ -2433,3 +2442,484 @@ class FPGA_Reg:
 
 
 #marker_template_end
+
+
+# Post-processing of the generated tables. It lives outside of the template markers so that
+# regenerating the register map keeps it.
+
+
+@dataclass(slots=True, frozen=True)
+class FieldSpec(Mapping):
+    """
+        Position of a bitfield within its register. It is also a read-only mapping with the generated
+        key names ("MSB", "LSB", "mask", "shift"), for code written against the plain dicts.
+    """
+    msb: int
+    lsb: int
+    mask: int
+    shift: int
+
+    def __getitem__(self, key):
+        return getattr(self, _FIELD_KEYS[key])
+
+    def __iter__(self):
+        return iter(_FIELD_KEYS)
+
+    def __len__(self):
+        return len(_FIELD_KEYS)
+
+
+_FIELD_KEYS = {"MSB": "msb", "LSB": "lsb", "mask": "mask", "shift": "shift"}
+
+
+@lru_cache(maxsize=None)
+def _field_spec(msb, lsb):
+    """
+        Create the FieldSpec of bits msb..lsb. Specs are cached, so every field at the same position
+        shares one object, e.g. the MODULE_INFO fields of all blocks or the fields of numbered instances.
+    """
+    return FieldSpec(msb, lsb, ((1 << (msb - lsb + 1)) - 1) << lsb, lsb)
+
+
+def _freeze(node):
+    """
+        Recursively intern the keys of a generated table and wrap every level in a read-only view.
+        Plain bitfields become FieldSpecs; other entries with MSB/LSB get a precomputed "mask" and "shift".
+    """
+    if not isinstance(node, dict):
+        return node
+    if node.keys() == {"MSB", "LSB"}:
+        return _field_spec(node["MSB"], node["LSB"])
+    frozen = {sys.intern(key): _freeze(value) for key, value in node.items()}
+    if "MSB" in frozen and "LSB" in frozen:
+        lsb = frozen["LSB"]
+        frozen["mask"] = ((1 << (frozen["MSB"] - lsb + 1)) - 1) << lsb
+        frozen["shift"] = lsb
+    return MappingProxyType(frozen)
+
+
+def _collect_bases(registers):
+    """
+        Collect the base address of every numbered module instance (e.g. wfg_stim_mem_top_0..3)
+    """
+    bases = {}
+    for block, regs in registers.items():
+        if block.rpartition("_")[2].isdigit():
+            bases[block] = min(entries["addr"] for entries in regs.values())
+    return MappingProxyType(bases)
+
+
+def _split_select_options(interconnect):
+    """
+        Move the source codes of the interconnect select registers into an "options" mapping, shared
+        by reference between all registers that offer the same sources
+    """
+    shared = {}
+    selects = {}
+    for reg, entries in interconnect.items():
+        options = {key: value for key, value in entries.items() if key not in ("addr", "MSB", "LSB")}
+        options = shared.setdefault(tuple(options.items()), _freeze(options))
+        selects[reg] = {"addr": entries["addr"], "options": options, "MSB": entries["MSB"], "LSB": entries["LSB"]}
+    return selects
+
+
+FPGA_Reg.output_pins = _freeze(FPGA_Reg.output_pins)
+FPGA_Reg.input_pins = _freeze(FPGA_Reg.input_pins)
+FPGA_Reg.registers = _freeze(dict(
+    FPGA_Reg.registers,
+    wfg_interconnect_top=_split_select_options(FPGA_Reg.registers["wfg_interconnect_top"])
+))
+FPGA_Reg.bases = _collect_bases(FPGA_Reg.registers)
+
+# Module-level alias of the register map, saving the class attribute lookup at call sites:
+# from fpga_reg import REGISTERS as R; R["wfg_drive_i2ct_top_0"]["CFG"]["DEVID"]["LSB"]
+REGISTERS = FPGA_Reg.registers
+
+
+class Field(NamedTuple):
+    """
+        Register address and position of a single field
+    """
+    addr: int
+    mask: int
+    shift: int
+
+
+def _build_flat(registers):
+    """
+        Flatten every register field into a (block, register, field) -> Field(addr, mask, shift) table
+    """
+    flat = {}
+    for block, regs in registers.items():
+        for reg, entries in regs.items():
+            for field, spec in entries.items():
+                if isinstance(spec, FieldSpec):
+                    flat[block, reg, field] = Field(entries["addr"], spec.mask, spec.shift)
+    return flat
+
+
+FPGA_Reg.flat = _build_flat(FPGA_Reg.registers)
+# The same Field objects keyed by dotted name, e.g. FPGA_Reg.F["wfg_drive_i2ct_top_0.CFG.DEVID"]
+FPGA_Reg.F = {".".join(key): field for key, field in FPGA_Reg.flat.items()}
+
+
+def read_field(sw, block, reg, field):
+    """
+        Read a single register field from the FPGA
+    """
+    addr, mask, shift = FPGA_Reg.flat[block, reg, field]
+    return (sw.readFPGARegister(addr) & mask) >> shift
+
+
+def write_field(sw, block, reg, field, value):
+    """
+        Read-modify-write a single register field on the FPGA, leaving the other fields untouched
+    """
+    addr, mask, shift = FPGA_Reg.flat[block, reg, field]
+    word = sw.readFPGARegister(addr) & ~mask
+    sw.writeFPGARegister(addr, word | ((value << shift) & mask))
+
+
+FPGA_Reg.read_field = staticmethod(read_field)
+FPGA_Reg.write_field = staticmethod(write_field)
+
+
+def _build_soa(fields):
+    """
+        Turn the (name, addr, mask, shift) rows of one block into parallel NumPy arrays
+    """
+    import numpy as np
+
+    names, addrs, masks, shifts = zip(*fields)
+    regs = sorted(set(addrs))
+    return SimpleNamespace(
+        names=np.array(names, dtype=object),
+        addrs=np.array(addrs, dtype=np.uint32),
+        masks=np.array(masks, dtype=np.uint32),
+        shifts=np.array(shifts, dtype=np.uint8),
+        regs=np.array(regs, dtype=np.uint32),
+        addr_idx=np.searchsorted(regs, addrs)
+    )
+
+
+class _LazySoA(Mapping):
+    """
+        Read-only mapping of block -> SoA arrays. NumPy is only imported, and the arrays of a block
+        are only built, on first access to that block.
+    """
+    def __init__(self, flat):
+        self._rows = {}
+        for (block, reg, field), entry in flat.items():
+            self._rows.setdefault(block, []).append((f"{reg}.{field}",) + entry)
+        self._cache = {}
+
+    def __getitem__(self, block):
+        soa = self._cache.get(block)
+        if soa is None:
+            soa = self._cache[block] = _build_soa(self._rows[block])
+        return soa
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+
+FPGA_Reg.soa = _LazySoA(FPGA_Reg.flat)
+
+
+def read_block(sw, block):
+    """
+        Read every register of a block once and decode all of its fields in a single vectorized step
+    """
+    import numpy as np
+
+    soa = FPGA_Reg.soa[block]
+    words = np.fromiter((sw.readFPGARegister(int(addr)) for addr in soa.regs), dtype=np.uint32, count=len(soa.regs))
+    values = (words[soa.addr_idx] & soa.masks) >> soa.shifts
+    return dict(zip(soa.names, values.tolist()))
+
+
+FPGA_Reg.read_block = staticmethod(read_block)
+
+
+FPGA_Reg.output_names = tuple(FPGA_Reg.output_pins.keys())
+FPGA_Reg.output_bits = tuple(FPGA_Reg.output_pins.values())
+FPGA_Reg.input_names = tuple(FPGA_Reg.input_pins.keys())
+FPGA_Reg.input_bits = tuple(FPGA_Reg.input_pins.values())
+OutputPin = FPGA_Reg.OutputPin = IntEnum("OutputPin", dict(FPGA_Reg.output_pins))
+InputPin = FPGA_Reg.InputPin = IntEnum("InputPin", dict(FPGA_Reg.input_pins))
+
+FPGA_Reg.output_pin_mask = MappingProxyType({name: 1 << pos for name, pos in FPGA_Reg.output_pins.items()})
+
+
+def pack_pins(names):
+    """
+        OR the one-hot masks of the given output signals into a single bitmask
+    """
+    mask = 0
+    get = FPGA_Reg.output_pin_mask.__getitem__
+    for name in names:
+        mask |= get(name)
+    return mask
+
+
+FPGA_Reg.pack_pins = staticmethod(pack_pins)
+
+
+def _build_trie(names):
+    """
+        Build a character trie of the given names; the key "" marks the end of a name
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = name
+    return trie
+
+
+def _walk_trie(node):
+    """
+        Yield every name stored below a trie node
+    """
+    for char, child in node.items():
+        if char:
+            yield from _walk_trie(child)
+        else:
+            yield child
+
+
+FPGA_Reg.prefix_trie = _build_trie(FPGA_Reg.registers.keys())
+
+
+def find_blocks(prefix):
+    """
+        Return the names of all blocks starting with the given prefix, e.g. "wfg_drive_spi_top_"
+    """
+    node = FPGA_Reg.prefix_trie
+    for char in prefix:
+        node = node.get(char)
+        if node is None:
+            return []
+    return list(_walk_trie(node))
+
+
+FPGA_Reg.find_blocks = staticmethod(find_blocks)
+
+
+@lru_cache(maxsize=None)
+def field_mask_shift(block, reg, field=None):
+    """
+        Return (mask, shift) of a register field, or of a select register itself when no field is given
+    """
+    spec = REGISTERS[block][reg]
+    if field is not None:
+        spec = spec[field]
+    return spec["mask"], spec["shift"]
+
+
+FPGA_Reg.field_mask_shift = staticmethod(field_mask_shift)
+
+
+def write_c_header(path):
+    """
+        Write the register map as C preprocessor constants, so C/HLS tooling can include it
+        instead of parsing the Python tables
+    """
+    lines = ["/* Generated from fpga_reg.py - do not edit */", "#ifndef FPGA_REG_H", "#define FPGA_REG_H", ""]
+    for block, regs in REGISTERS.items():
+        for reg, entries in regs.items():
+            prefix = f"{block}_{reg}".upper()
+            lines.append(f"#define {prefix}_ADDR 0x{entries['addr']:x}u")
+            if "options" in entries:
+                lines.append(f"#define {prefix}_MASK 0x{entries['mask']:x}u")
+                lines.append(f"#define {prefix}_SHIFT {entries['shift']}u")
+                for source, code in entries["options"].items():
+                    lines.append(f"#define {prefix}_{source.upper()} 0x{code:x}u")
+            for field, spec in entries.items():
+                # Unnamed fields (the reserved bit 31 of the UART CTRL registers) get no constants
+                if isinstance(spec, FieldSpec) and field:
+                    lines.append(f"#define {prefix}_{field.upper()}_MASK 0x{spec.mask:x}u")
+                    lines.append(f"#define {prefix}_{field.upper()}_SHIFT {spec.shift}u")
+        lines.append("")
+    lines.append("#endif /* FPGA_REG_H */")
+    with open(path, "w", encoding="utf-8") as header:
+        header.write("\n".join(lines) + "\n")
+
+
+class WriteBatch:
+    """
+        Collects field writes and coalesces them per register address, so that flush() sends one
+        register write per address, all in a single transfer. Fields that are not set are written as 0.
+    """
+    def __init__(self):
+        self.words = {}
+
+    def set(self, block, reg, field, value):
+        addr, mask, shift = FPGA_Reg.flat[block, reg, field]
+        self.words[addr] = (self.words.get(addr, 0) & ~mask) | ((value << shift) & mask)
+
+    def flush(self, sw):
+        write_burst(sw, self.words.items())
+        self.words.clear()
+
+
+def write_burst(sw, writes):
+    """
+        Write several (addr, value) pairs to the FPGA with a single transfer to SmartWave. The frames are
+        the ones SmartWave.writeFPGARegister sends, concatenated.
+    """
+    from SmartWaveAPI.definitions import Command
+
+    opcode = bytes([Command.FpgaWrite.value])
+    frames = b"".join(opcode + addr.to_bytes(3, "big") + value.to_bytes(4, "big") for addr, value in writes)
+    if frames:
+        sw.writeToDevice(frames)
+
+
+FPGA_Reg.WriteBatch = WriteBatch
+FPGA_Reg.write_burst = staticmethod(write_burst)
+
+
+def _build_reverse(registers):
+    """
+        Collect every register as parallel tuples of addresses and "block.reg" names, sorted by address
+    """
+    pairs = sorted((entries["addr"], f"{block}.{reg}") for block, regs in registers.items()
+                   for reg, entries in regs.items())
+    addrs, names = zip(*pairs)
+    return addrs, names
+
+
+FPGA_Reg.reg_addrs, FPGA_Reg.reg_names = _build_reverse(FPGA_Reg.registers)
+
+
+def name_at(addr):
+    """
+        Return the "block.reg" name of the register at the given address
+    """
+    idx = bisect_left(FPGA_Reg.reg_addrs, addr)
+    if idx == len(FPGA_Reg.reg_addrs) or FPGA_Reg.reg_addrs[idx] != addr:
+        raise KeyError(f"No register at address {addr:#0x}")
+    return FPGA_Reg.reg_names[idx]
+
+
+FPGA_Reg.name_at = staticmethod(name_at)
+
+
+# Integer-indexed field tables: FieldId.<BLOCK>_<REG>_<FIELD>_FIELD is an index into the parallel tuples
+# below. The suffix keeps the ids apart from the <BLOCK>_<REG>_ADDR constants of fpga_reg.h and
+# fpga_regs_gen.py, e.g. the REGADDR field id is WFG_DRIVE_I2CT_TOP_0_REGADDR_ADDR_FIELD.
+FieldId = FPGA_Reg.FieldId = SimpleNamespace(**{
+    f"{block}_{reg}_{field}_FIELD".upper(): idx for idx, (block, reg, field) in enumerate(FPGA_Reg.flat)
+})
+_FIELD_ADDRS, _FIELD_MASKS, _FIELD_SHIFTS = zip(*FPGA_Reg.flat.values())
+FPGA_Reg.field_addrs, FPGA_Reg.field_masks, FPGA_Reg.field_shifts = _FIELD_ADDRS, _FIELD_MASKS, _FIELD_SHIFTS
+
+
+def pack_field(field_id, word, value):
+    """
+        Return the register word with the field identified by field_id replaced by value
+    """
+    mask = _FIELD_MASKS[field_id]
+    return (word & ~mask) | ((value << _FIELD_SHIFTS[field_id]) & mask)
+
+
+def unpack_field(field_id, word):
+    """
+        Extract the field identified by field_id from a register word
+    """
+    return (word & _FIELD_MASKS[field_id]) >> _FIELD_SHIFTS[field_id]
+
+
+FPGA_Reg.pack_field = staticmethod(pack_field)
+FPGA_Reg.unpack_field = staticmethod(unpack_field)
+
+
+def _build_code_index(options):
+    """
+        Invert the options of a select register into code -> tuple of source names
+    """
+    index = {}
+    for name, code in options.items():
+        index[code] = index.get(code, ()) + (name,)
+    return MappingProxyType(index)
+
+
+def _build_select_codes(interconnect):
+    """
+        Build the code index of every interconnect select register; registers sharing their options
+        also share the index
+    """
+    indexes = {}
+    return MappingProxyType({
+        reg: indexes.setdefault(id(entries["options"]), _build_code_index(entries["options"]))
+        for reg, entries in interconnect.items()
+    })
+
+
+# Note: in the generated data wfg_drive_i2c_top_0 and wfg_drive_i2ct_top_0 share the record memory
+# select code 0x21, so a code can map to more than one source. This has to be fixed in the register
+# description of wfg_record_mem, not here.
+FPGA_Reg.select_codes = _build_select_codes(FPGA_Reg.registers["wfg_interconnect_top"])
+FPGA_Reg.record_mem_codes = FPGA_Reg.select_codes["wfg_record_mem_top_0_select_0"]
+
+
+def _build_pin_sel(kind):
+    """
+        Build the (addr, mask, shift) of every pin's 8-bit selection in the <kind>_SEL_* registers of
+        the pin mux, indexed by pin number
+    """
+    pins = {}
+    for reg, entries in REGISTERS["wfg_pin_mux_top"].items():
+        if reg.startswith(f"{kind}_SEL_"):
+            for pin, spec in entries.items():
+                if isinstance(spec, FieldSpec):
+                    pins[int(pin)] = (entries["addr"], spec.mask, spec.shift)
+    return tuple(pins[pin] for pin in range(len(pins)))
+
+
+FPGA_Reg.output_sel = _build_pin_sel("OUTPUT")
+FPGA_Reg.pullup_sel = _build_pin_sel("PULLUP")
+FPGA_Reg.input_sel = _build_pin_sel("INPUT")
+
+
+def _pin_sel_write(table, sw, pin, value):
+    """
+        Read-modify-write the selection of a single pin
+    """
+    addr, mask, shift = table[pin]
+    sw.writeFPGARegister(addr, (sw.readFPGARegister(addr) & ~mask) | ((value << shift) & mask))
+
+
+def output_sel_write(sw, pin, value):
+    """
+        Route the output with the given select value onto a pin
+    """
+    _pin_sel_write(FPGA_Reg.output_sel, sw, pin, value)
+
+
+def pullup_sel_write(sw, pin, value):
+    """
+        Set the pull-up selection of a pin
+    """
+    _pin_sel_write(FPGA_Reg.pullup_sel, sw, pin, value)
+
+
+def input_sel_write(sw, pin, value):
+    """
+        Route a pin onto the input with the given select value
+    """
+    _pin_sel_write(FPGA_Reg.input_sel, sw, pin, value)
+
+
+FPGA_Reg.output_sel_write = staticmethod(output_sel_write)
+FPGA_Reg.pullup_sel_write = staticmethod(pullup_sel_write)
+FPGA_Reg.input_sel_write = staticmethod(input_sel_write)
+
+
+if __name__ == "__main__":
+    write_c_header(sys.argv[1] if len(sys.argv) > 1 else "fpga_reg.h")
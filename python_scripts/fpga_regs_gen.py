@@ -0,0 +1,3670 @@
+"""
+Register bindings generated by tools/gen_regs.py from fpga_reg.py - do not edit
+"""
+
+
+WFG_INTERCONNECT_TOP_WFG_DRIVE_SPI_TOP_0_SELECT_0_ADDR = 0x44000
+
+
+def encode_wfg_interconnect_top_wfg_drive_spi_top_0_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_drive_spi_top_0_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_SPI_TOP_0_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_drive_spi_top_0_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_drive_spi_top_0_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_drive_spi_top_0_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_drive_spi_top_0_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_SPI_TOP_0_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_DRIVE_SPI_TOP_1_SELECT_0_ADDR = 0x44001
+
+
+def encode_wfg_interconnect_top_wfg_drive_spi_top_1_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_drive_spi_top_1_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_SPI_TOP_1_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_drive_spi_top_1_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_drive_spi_top_1_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_drive_spi_top_1_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_drive_spi_top_1_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_SPI_TOP_1_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_DRIVE_PAT_TOP_0_SELECT_0_ADDR = 0x44010
+
+
+def encode_wfg_interconnect_top_wfg_drive_pat_top_0_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_drive_pat_top_0_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_PAT_TOP_0_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_drive_pat_top_0_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_drive_pat_top_0_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_drive_pat_top_0_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_drive_pat_top_0_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_PAT_TOP_0_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_DRIVE_I2C_TOP_0_SELECT_0_ADDR = 0x44020
+
+
+def encode_wfg_interconnect_top_wfg_drive_i2c_top_0_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_drive_i2c_top_0_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_I2C_TOP_0_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_drive_i2c_top_0_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_drive_i2c_top_0_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_drive_i2c_top_0_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_drive_i2c_top_0_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_I2C_TOP_0_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_DRIVE_I2C_TOP_1_SELECT_0_ADDR = 0x44021
+
+
+def encode_wfg_interconnect_top_wfg_drive_i2c_top_1_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_drive_i2c_top_1_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_I2C_TOP_1_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_drive_i2c_top_1_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_drive_i2c_top_1_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_drive_i2c_top_1_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_drive_i2c_top_1_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_I2C_TOP_1_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_DRIVE_UART_TOP_0_SELECT_0_ADDR = 0x44030
+
+
+def encode_wfg_interconnect_top_wfg_drive_uart_top_0_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_drive_uart_top_0_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_UART_TOP_0_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_drive_uart_top_0_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_drive_uart_top_0_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_drive_uart_top_0_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_drive_uart_top_0_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_UART_TOP_0_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_DRIVE_UART_TOP_1_SELECT_0_ADDR = 0x44031
+
+
+def encode_wfg_interconnect_top_wfg_drive_uart_top_1_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_drive_uart_top_1_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_UART_TOP_1_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_drive_uart_top_1_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_drive_uart_top_1_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_drive_uart_top_1_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_drive_uart_top_1_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_DRIVE_UART_TOP_1_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_0_SELECT_0_ADDR = 0x440f0
+
+
+def encode_wfg_interconnect_top_wfg_record_mem_top_0_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_record_mem_top_0_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_0_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_record_mem_top_0_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_record_mem_top_0_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_record_mem_top_0_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_record_mem_top_0_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_0_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_1_SELECT_0_ADDR = 0x440f1
+
+
+def encode_wfg_interconnect_top_wfg_record_mem_top_1_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_record_mem_top_1_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_1_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_record_mem_top_1_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_record_mem_top_1_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_record_mem_top_1_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_record_mem_top_1_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_1_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_2_SELECT_0_ADDR = 0x440f2
+
+
+def encode_wfg_interconnect_top_wfg_record_mem_top_2_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_record_mem_top_2_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_2_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_record_mem_top_2_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_record_mem_top_2_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_record_mem_top_2_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_record_mem_top_2_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_2_SELECT_0_ADDR))
+
+
+WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_3_SELECT_0_ADDR = 0x440f3
+
+
+def encode_wfg_interconnect_top_wfg_record_mem_top_3_select_0(value=0):
+    return (value & 0xff)
+
+
+def set_wfg_interconnect_top_wfg_record_mem_top_3_select_0(sw, value=0):
+    sw.writeFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_3_SELECT_0_ADDR, encode_wfg_interconnect_top_wfg_record_mem_top_3_select_0(value))
+
+
+def decode_wfg_interconnect_top_wfg_record_mem_top_3_select_0(word):
+    return {"value": word & 0xff}
+
+
+def get_wfg_interconnect_top_wfg_record_mem_top_3_select_0(sw):
+    return decode_wfg_interconnect_top_wfg_record_mem_top_3_select_0(sw.readFPGARegister(WFG_INTERCONNECT_TOP_WFG_RECORD_MEM_TOP_3_SELECT_0_ADDR))
+
+
+WFG_CORE_TOP_CTRL_ADDR = 0x40000
+
+
+def encode_wfg_core_top_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_core_top_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_CORE_TOP_CTRL_ADDR, encode_wfg_core_top_ctrl(en))
+
+
+def decode_wfg_core_top_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_core_top_ctrl(sw):
+    return decode_wfg_core_top_ctrl(sw.readFPGARegister(WFG_CORE_TOP_CTRL_ADDR))
+
+
+WFG_CORE_TOP_CFG_ADDR = 0x40004
+
+
+def encode_wfg_core_top_cfg(sync=0, subcycle=0):
+    return (sync & 0xffff) | ((subcycle << 16) & 0xffff0000)
+
+
+def set_wfg_core_top_cfg(sw, sync=0, subcycle=0):
+    sw.writeFPGARegister(WFG_CORE_TOP_CFG_ADDR, encode_wfg_core_top_cfg(sync, subcycle))
+
+
+def decode_wfg_core_top_cfg(word):
+    return {"SYNC": word & 0xffff, "SUBCYCLE": (word & 0xffff0000) >> 16}
+
+
+def get_wfg_core_top_cfg(sw):
+    return decode_wfg_core_top_cfg(sw.readFPGARegister(WFG_CORE_TOP_CFG_ADDR))
+
+
+WFG_CORE_TOP_MODULE_INFO_ADDR = 0x400fc
+
+
+def encode_wfg_core_top_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_core_top_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_CORE_TOP_MODULE_INFO_ADDR, encode_wfg_core_top_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_core_top_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_core_top_module_info(sw):
+    return decode_wfg_core_top_module_info(sw.readFPGARegister(WFG_CORE_TOP_MODULE_INFO_ADDR))
+
+
+WFG_PIN_MUX_TOP_OUTPUT_SEL_0_ADDR = 0x46000
+
+
+def encode_wfg_pin_mux_top_output_sel_0(pin_0=0, pin_1=0, pin_2=0, pin_3=0):
+    return (pin_0 & 0xff) | ((pin_1 << 8) & 0xff00) | ((pin_2 << 16) & 0xff0000) | ((pin_3 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_output_sel_0(sw, pin_0=0, pin_1=0, pin_2=0, pin_3=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_0_ADDR, encode_wfg_pin_mux_top_output_sel_0(pin_0, pin_1, pin_2, pin_3))
+
+
+def decode_wfg_pin_mux_top_output_sel_0(word):
+    return {"0": word & 0xff, "1": (word & 0xff00) >> 8, "2": (word & 0xff0000) >> 16, "3": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_output_sel_0(sw):
+    return decode_wfg_pin_mux_top_output_sel_0(sw.readFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_0_ADDR))
+
+
+WFG_PIN_MUX_TOP_OUTPUT_SEL_1_ADDR = 0x46004
+
+
+def encode_wfg_pin_mux_top_output_sel_1(pin_4=0, pin_5=0, pin_6=0, pin_7=0):
+    return (pin_4 & 0xff) | ((pin_5 << 8) & 0xff00) | ((pin_6 << 16) & 0xff0000) | ((pin_7 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_output_sel_1(sw, pin_4=0, pin_5=0, pin_6=0, pin_7=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_1_ADDR, encode_wfg_pin_mux_top_output_sel_1(pin_4, pin_5, pin_6, pin_7))
+
+
+def decode_wfg_pin_mux_top_output_sel_1(word):
+    return {"4": word & 0xff, "5": (word & 0xff00) >> 8, "6": (word & 0xff0000) >> 16, "7": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_output_sel_1(sw):
+    return decode_wfg_pin_mux_top_output_sel_1(sw.readFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_1_ADDR))
+
+
+WFG_PIN_MUX_TOP_OUTPUT_SEL_2_ADDR = 0x46008
+
+
+def encode_wfg_pin_mux_top_output_sel_2(pin_8=0, pin_9=0, pin_10=0, pin_11=0):
+    return (pin_8 & 0xff) | ((pin_9 << 8) & 0xff00) | ((pin_10 << 16) & 0xff0000) | ((pin_11 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_output_sel_2(sw, pin_8=0, pin_9=0, pin_10=0, pin_11=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_2_ADDR, encode_wfg_pin_mux_top_output_sel_2(pin_8, pin_9, pin_10, pin_11))
+
+
+def decode_wfg_pin_mux_top_output_sel_2(word):
+    return {"8": word & 0xff, "9": (word & 0xff00) >> 8, "10": (word & 0xff0000) >> 16, "11": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_output_sel_2(sw):
+    return decode_wfg_pin_mux_top_output_sel_2(sw.readFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_2_ADDR))
+
+
+WFG_PIN_MUX_TOP_OUTPUT_SEL_3_ADDR = 0x4600c
+
+
+def encode_wfg_pin_mux_top_output_sel_3(pin_12=0, pin_13=0, pin_14=0, pin_15=0):
+    return (pin_12 & 0xff) | ((pin_13 << 8) & 0xff00) | ((pin_14 << 16) & 0xff0000) | ((pin_15 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_output_sel_3(sw, pin_12=0, pin_13=0, pin_14=0, pin_15=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_3_ADDR, encode_wfg_pin_mux_top_output_sel_3(pin_12, pin_13, pin_14, pin_15))
+
+
+def decode_wfg_pin_mux_top_output_sel_3(word):
+    return {"12": word & 0xff, "13": (word & 0xff00) >> 8, "14": (word & 0xff0000) >> 16, "15": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_output_sel_3(sw):
+    return decode_wfg_pin_mux_top_output_sel_3(sw.readFPGARegister(WFG_PIN_MUX_TOP_OUTPUT_SEL_3_ADDR))
+
+
+WFG_PIN_MUX_TOP_PULLUP_SEL_0_ADDR = 0x46010
+
+
+def encode_wfg_pin_mux_top_pullup_sel_0(pin_0=0, pin_1=0, pin_2=0, pin_3=0):
+    return (pin_0 & 0xff) | ((pin_1 << 8) & 0xff00) | ((pin_2 << 16) & 0xff0000) | ((pin_3 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_pullup_sel_0(sw, pin_0=0, pin_1=0, pin_2=0, pin_3=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_0_ADDR, encode_wfg_pin_mux_top_pullup_sel_0(pin_0, pin_1, pin_2, pin_3))
+
+
+def decode_wfg_pin_mux_top_pullup_sel_0(word):
+    return {"0": word & 0xff, "1": (word & 0xff00) >> 8, "2": (word & 0xff0000) >> 16, "3": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_pullup_sel_0(sw):
+    return decode_wfg_pin_mux_top_pullup_sel_0(sw.readFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_0_ADDR))
+
+
+WFG_PIN_MUX_TOP_PULLUP_SEL_1_ADDR = 0x46014
+
+
+def encode_wfg_pin_mux_top_pullup_sel_1(pin_4=0, pin_5=0, pin_6=0, pin_7=0):
+    return (pin_4 & 0xff) | ((pin_5 << 8) & 0xff00) | ((pin_6 << 16) & 0xff0000) | ((pin_7 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_pullup_sel_1(sw, pin_4=0, pin_5=0, pin_6=0, pin_7=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_1_ADDR, encode_wfg_pin_mux_top_pullup_sel_1(pin_4, pin_5, pin_6, pin_7))
+
+
+def decode_wfg_pin_mux_top_pullup_sel_1(word):
+    return {"4": word & 0xff, "5": (word & 0xff00) >> 8, "6": (word & 0xff0000) >> 16, "7": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_pullup_sel_1(sw):
+    return decode_wfg_pin_mux_top_pullup_sel_1(sw.readFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_1_ADDR))
+
+
+WFG_PIN_MUX_TOP_PULLUP_SEL_2_ADDR = 0x46018
+
+
+def encode_wfg_pin_mux_top_pullup_sel_2(pin_8=0, pin_9=0, pin_10=0, pin_11=0):
+    return (pin_8 & 0xff) | ((pin_9 << 8) & 0xff00) | ((pin_10 << 16) & 0xff0000) | ((pin_11 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_pullup_sel_2(sw, pin_8=0, pin_9=0, pin_10=0, pin_11=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_2_ADDR, encode_wfg_pin_mux_top_pullup_sel_2(pin_8, pin_9, pin_10, pin_11))
+
+
+def decode_wfg_pin_mux_top_pullup_sel_2(word):
+    return {"8": word & 0xff, "9": (word & 0xff00) >> 8, "10": (word & 0xff0000) >> 16, "11": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_pullup_sel_2(sw):
+    return decode_wfg_pin_mux_top_pullup_sel_2(sw.readFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_2_ADDR))
+
+
+WFG_PIN_MUX_TOP_PULLUP_SEL_3_ADDR = 0x4601c
+
+
+def encode_wfg_pin_mux_top_pullup_sel_3(pin_12=0, pin_13=0, pin_14=0, pin_15=0):
+    return (pin_12 & 0xff) | ((pin_13 << 8) & 0xff00) | ((pin_14 << 16) & 0xff0000) | ((pin_15 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_pullup_sel_3(sw, pin_12=0, pin_13=0, pin_14=0, pin_15=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_3_ADDR, encode_wfg_pin_mux_top_pullup_sel_3(pin_12, pin_13, pin_14, pin_15))
+
+
+def decode_wfg_pin_mux_top_pullup_sel_3(word):
+    return {"12": word & 0xff, "13": (word & 0xff00) >> 8, "14": (word & 0xff0000) >> 16, "15": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_pullup_sel_3(sw):
+    return decode_wfg_pin_mux_top_pullup_sel_3(sw.readFPGARegister(WFG_PIN_MUX_TOP_PULLUP_SEL_3_ADDR))
+
+
+WFG_PIN_MUX_TOP_INPUT_SEL_0_ADDR = 0x46020
+
+
+def encode_wfg_pin_mux_top_input_sel_0(pin_0=0, pin_1=0, pin_2=0, pin_3=0):
+    return (pin_0 & 0xff) | ((pin_1 << 8) & 0xff00) | ((pin_2 << 16) & 0xff0000) | ((pin_3 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_input_sel_0(sw, pin_0=0, pin_1=0, pin_2=0, pin_3=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_0_ADDR, encode_wfg_pin_mux_top_input_sel_0(pin_0, pin_1, pin_2, pin_3))
+
+
+def decode_wfg_pin_mux_top_input_sel_0(word):
+    return {"0": word & 0xff, "1": (word & 0xff00) >> 8, "2": (word & 0xff0000) >> 16, "3": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_input_sel_0(sw):
+    return decode_wfg_pin_mux_top_input_sel_0(sw.readFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_0_ADDR))
+
+
+WFG_PIN_MUX_TOP_INPUT_SEL_1_ADDR = 0x46024
+
+
+def encode_wfg_pin_mux_top_input_sel_1(pin_4=0, pin_5=0, pin_6=0, pin_7=0):
+    return (pin_4 & 0xff) | ((pin_5 << 8) & 0xff00) | ((pin_6 << 16) & 0xff0000) | ((pin_7 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_input_sel_1(sw, pin_4=0, pin_5=0, pin_6=0, pin_7=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_1_ADDR, encode_wfg_pin_mux_top_input_sel_1(pin_4, pin_5, pin_6, pin_7))
+
+
+def decode_wfg_pin_mux_top_input_sel_1(word):
+    return {"4": word & 0xff, "5": (word & 0xff00) >> 8, "6": (word & 0xff0000) >> 16, "7": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_input_sel_1(sw):
+    return decode_wfg_pin_mux_top_input_sel_1(sw.readFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_1_ADDR))
+
+
+WFG_PIN_MUX_TOP_INPUT_SEL_2_ADDR = 0x46028
+
+
+def encode_wfg_pin_mux_top_input_sel_2(pin_8=0, pin_9=0, pin_10=0, pin_11=0):
+    return (pin_8 & 0xff) | ((pin_9 << 8) & 0xff00) | ((pin_10 << 16) & 0xff0000) | ((pin_11 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_input_sel_2(sw, pin_8=0, pin_9=0, pin_10=0, pin_11=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_2_ADDR, encode_wfg_pin_mux_top_input_sel_2(pin_8, pin_9, pin_10, pin_11))
+
+
+def decode_wfg_pin_mux_top_input_sel_2(word):
+    return {"8": word & 0xff, "9": (word & 0xff00) >> 8, "10": (word & 0xff0000) >> 16, "11": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_input_sel_2(sw):
+    return decode_wfg_pin_mux_top_input_sel_2(sw.readFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_2_ADDR))
+
+
+WFG_PIN_MUX_TOP_INPUT_SEL_3_ADDR = 0x4602c
+
+
+def encode_wfg_pin_mux_top_input_sel_3(pin_12=0, pin_13=0, pin_14=0, pin_15=0):
+    return (pin_12 & 0xff) | ((pin_13 << 8) & 0xff00) | ((pin_14 << 16) & 0xff0000) | ((pin_15 << 24) & 0xff000000)
+
+
+def set_wfg_pin_mux_top_input_sel_3(sw, pin_12=0, pin_13=0, pin_14=0, pin_15=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_3_ADDR, encode_wfg_pin_mux_top_input_sel_3(pin_12, pin_13, pin_14, pin_15))
+
+
+def decode_wfg_pin_mux_top_input_sel_3(word):
+    return {"12": word & 0xff, "13": (word & 0xff00) >> 8, "14": (word & 0xff0000) >> 16, "15": (word & 0xff000000) >> 24}
+
+
+def get_wfg_pin_mux_top_input_sel_3(sw):
+    return decode_wfg_pin_mux_top_input_sel_3(sw.readFPGARegister(WFG_PIN_MUX_TOP_INPUT_SEL_3_ADDR))
+
+
+WFG_PIN_MUX_TOP_MIRROR_OUTPUT_ADDR = 0x46030
+
+
+def encode_wfg_pin_mux_top_mirror_output(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_pin_mux_top_mirror_output(sw, val=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_MIRROR_OUTPUT_ADDR, encode_wfg_pin_mux_top_mirror_output(val))
+
+
+def decode_wfg_pin_mux_top_mirror_output(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_mirror_output(sw):
+    return decode_wfg_pin_mux_top_mirror_output(sw.readFPGARegister(WFG_PIN_MUX_TOP_MIRROR_OUTPUT_ADDR))
+
+
+WFG_PIN_MUX_TOP_MIRROR_PULLUP_ADDR = 0x46034
+
+
+def encode_wfg_pin_mux_top_mirror_pullup(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_pin_mux_top_mirror_pullup(sw, val=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_MIRROR_PULLUP_ADDR, encode_wfg_pin_mux_top_mirror_pullup(val))
+
+
+def decode_wfg_pin_mux_top_mirror_pullup(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_mirror_pullup(sw):
+    return decode_wfg_pin_mux_top_mirror_pullup(sw.readFPGARegister(WFG_PIN_MUX_TOP_MIRROR_PULLUP_ADDR))
+
+
+WFG_PIN_MUX_TOP_MIRROR_INPUT_ADDR = 0x46038
+
+
+def encode_wfg_pin_mux_top_mirror_input(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_pin_mux_top_mirror_input(sw, val=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_MIRROR_INPUT_ADDR, encode_wfg_pin_mux_top_mirror_input(val))
+
+
+def decode_wfg_pin_mux_top_mirror_input(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_mirror_input(sw):
+    return decode_wfg_pin_mux_top_mirror_input(sw.readFPGARegister(WFG_PIN_MUX_TOP_MIRROR_INPUT_ADDR))
+
+
+WFG_PIN_MUX_TOP_PIN_IR_RISING_ADDR = 0x46090
+
+
+def encode_wfg_pin_mux_top_pin_ir_rising(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_pin_mux_top_pin_ir_rising(sw, val=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_PIN_IR_RISING_ADDR, encode_wfg_pin_mux_top_pin_ir_rising(val))
+
+
+def decode_wfg_pin_mux_top_pin_ir_rising(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_pin_ir_rising(sw):
+    return decode_wfg_pin_mux_top_pin_ir_rising(sw.readFPGARegister(WFG_PIN_MUX_TOP_PIN_IR_RISING_ADDR))
+
+
+WFG_PIN_MUX_TOP_PIN_IR_FALLING_ADDR = 0x46094
+
+
+def encode_wfg_pin_mux_top_pin_ir_falling(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_pin_mux_top_pin_ir_falling(sw, val=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_PIN_IR_FALLING_ADDR, encode_wfg_pin_mux_top_pin_ir_falling(val))
+
+
+def decode_wfg_pin_mux_top_pin_ir_falling(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_pin_ir_falling(sw):
+    return decode_wfg_pin_mux_top_pin_ir_falling(sw.readFPGARegister(WFG_PIN_MUX_TOP_PIN_IR_FALLING_ADDR))
+
+
+WFG_PIN_MUX_TOP_ISR_ADDR = 0x460a0
+
+
+def encode_wfg_pin_mux_top_isr(pin=0):
+    return (pin & 0xffff)
+
+
+def set_wfg_pin_mux_top_isr(sw, pin=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_ISR_ADDR, encode_wfg_pin_mux_top_isr(pin))
+
+
+def decode_wfg_pin_mux_top_isr(word):
+    return {"PIN": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_isr(sw):
+    return decode_wfg_pin_mux_top_isr(sw.readFPGARegister(WFG_PIN_MUX_TOP_ISR_ADDR))
+
+
+WFG_PIN_MUX_TOP_IER_ADDR = 0x460a4
+
+
+def encode_wfg_pin_mux_top_ier(pin=0):
+    return (pin & 0xffff)
+
+
+def set_wfg_pin_mux_top_ier(sw, pin=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_IER_ADDR, encode_wfg_pin_mux_top_ier(pin))
+
+
+def decode_wfg_pin_mux_top_ier(word):
+    return {"PIN": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_ier(sw):
+    return decode_wfg_pin_mux_top_ier(sw.readFPGARegister(WFG_PIN_MUX_TOP_IER_ADDR))
+
+
+WFG_PIN_MUX_TOP_ICR_ADDR = 0x460a8
+
+
+def encode_wfg_pin_mux_top_icr(pin=0):
+    return (pin & 0xffff)
+
+
+def set_wfg_pin_mux_top_icr(sw, pin=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_ICR_ADDR, encode_wfg_pin_mux_top_icr(pin))
+
+
+def decode_wfg_pin_mux_top_icr(word):
+    return {"PIN": word & 0xffff}
+
+
+def get_wfg_pin_mux_top_icr(sw):
+    return decode_wfg_pin_mux_top_icr(sw.readFPGARegister(WFG_PIN_MUX_TOP_ICR_ADDR))
+
+
+WFG_PIN_MUX_TOP_MODULE_INFO_ADDR = 0x460fc
+
+
+def encode_wfg_pin_mux_top_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_pin_mux_top_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_PIN_MUX_TOP_MODULE_INFO_ADDR, encode_wfg_pin_mux_top_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_pin_mux_top_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_pin_mux_top_module_info(sw):
+    return decode_wfg_pin_mux_top_module_info(sw.readFPGARegister(WFG_PIN_MUX_TOP_MODULE_INFO_ADDR))
+
+
+WFG_SYSCTRL_REG_PRODUCT_ADDR = 0x48000
+
+
+def encode_wfg_sysctrl_reg_product(id=0):
+    return (id & 0xffffffff)
+
+
+def set_wfg_sysctrl_reg_product(sw, id=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_PRODUCT_ADDR, encode_wfg_sysctrl_reg_product(id))
+
+
+def decode_wfg_sysctrl_reg_product(word):
+    return {"ID": word & 0xffffffff}
+
+
+def get_wfg_sysctrl_reg_product(sw):
+    return decode_wfg_sysctrl_reg_product(sw.readFPGARegister(WFG_SYSCTRL_REG_PRODUCT_ADDR))
+
+
+WFG_SYSCTRL_REG_FPGA_VERSION_ADDR = 0x48004
+
+
+def encode_wfg_sysctrl_reg_fpga_version(patch=0, minor=0, major=0, dev=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((dev << 24) & 0x1000000)
+
+
+def set_wfg_sysctrl_reg_fpga_version(sw, patch=0, minor=0, major=0, dev=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_FPGA_VERSION_ADDR, encode_wfg_sysctrl_reg_fpga_version(patch, minor, major, dev))
+
+
+def decode_wfg_sysctrl_reg_fpga_version(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "DEV": (word & 0x1000000) >> 24}
+
+
+def get_wfg_sysctrl_reg_fpga_version(sw):
+    return decode_wfg_sysctrl_reg_fpga_version(sw.readFPGARegister(WFG_SYSCTRL_REG_FPGA_VERSION_ADDR))
+
+
+WFG_SYSCTRL_REG_GENDATE_ADDR = 0x48008
+
+
+def encode_wfg_sysctrl_reg_gendate(year=0, month=0, day=0, hour=0, minute=0):
+    return (year & 0x7ff) | ((month << 11) & 0x7800) | ((day << 15) & 0xf8000) | ((hour << 20) & 0xf00000) | ((minute << 24) & 0x3f000000)
+
+
+def set_wfg_sysctrl_reg_gendate(sw, year=0, month=0, day=0, hour=0, minute=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_GENDATE_ADDR, encode_wfg_sysctrl_reg_gendate(year, month, day, hour, minute))
+
+
+def decode_wfg_sysctrl_reg_gendate(word):
+    return {"YEAR": word & 0x7ff, "MONTH": (word & 0x7800) >> 11, "DAY": (word & 0xf8000) >> 15, "HOUR": (word & 0xf00000) >> 20, "MINUTE": (word & 0x3f000000) >> 24}
+
+
+def get_wfg_sysctrl_reg_gendate(sw):
+    return decode_wfg_sysctrl_reg_gendate(sw.readFPGARegister(WFG_SYSCTRL_REG_GENDATE_ADDR))
+
+
+WFG_SYSCTRL_REG_CLK_SPEED_ADDR = 0x4800c
+
+
+def encode_wfg_sysctrl_reg_clk_speed(val=0):
+    return (val & 0xff)
+
+
+def set_wfg_sysctrl_reg_clk_speed(sw, val=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_CLK_SPEED_ADDR, encode_wfg_sysctrl_reg_clk_speed(val))
+
+
+def decode_wfg_sysctrl_reg_clk_speed(word):
+    return {"VAL": word & 0xff}
+
+
+def get_wfg_sysctrl_reg_clk_speed(sw):
+    return decode_wfg_sysctrl_reg_clk_speed(sw.readFPGARegister(WFG_SYSCTRL_REG_CLK_SPEED_ADDR))
+
+
+WFG_SYSCTRL_REG_SOC_CTRL_ADDR = 0x48010
+
+
+def encode_wfg_sysctrl_reg_soc_ctrl(fetch_enable=0, core_reset_n=0):
+    return (fetch_enable & 0x1) | ((core_reset_n << 1) & 0x2)
+
+
+def set_wfg_sysctrl_reg_soc_ctrl(sw, fetch_enable=0, core_reset_n=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_SOC_CTRL_ADDR, encode_wfg_sysctrl_reg_soc_ctrl(fetch_enable, core_reset_n))
+
+
+def decode_wfg_sysctrl_reg_soc_ctrl(word):
+    return {"FETCH_ENABLE": word & 0x1, "CORE_RESET_N": (word & 0x2) >> 1}
+
+
+def get_wfg_sysctrl_reg_soc_ctrl(sw):
+    return decode_wfg_sysctrl_reg_soc_ctrl(sw.readFPGARegister(WFG_SYSCTRL_REG_SOC_CTRL_ADDR))
+
+
+WFG_SYSCTRL_REG_SOC_STATUS_ADDR = 0x48014
+
+
+def encode_wfg_sysctrl_reg_soc_status(core_sleep=0):
+    return (core_sleep & 0x1)
+
+
+def set_wfg_sysctrl_reg_soc_status(sw, core_sleep=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_SOC_STATUS_ADDR, encode_wfg_sysctrl_reg_soc_status(core_sleep))
+
+
+def decode_wfg_sysctrl_reg_soc_status(word):
+    return {"CORE_SLEEP": word & 0x1}
+
+
+def get_wfg_sysctrl_reg_soc_status(sw):
+    return decode_wfg_sysctrl_reg_soc_status(sw.readFPGARegister(WFG_SYSCTRL_REG_SOC_STATUS_ADDR))
+
+
+WFG_SYSCTRL_REG_RESET_FLAGS_ADDR = 0x48020
+
+
+def encode_wfg_sysctrl_reg_reset_flags(wfg=0, soc=0):
+    return (wfg & 0x1) | ((soc << 1) & 0x2)
+
+
+def set_wfg_sysctrl_reg_reset_flags(sw, wfg=0, soc=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_RESET_FLAGS_ADDR, encode_wfg_sysctrl_reg_reset_flags(wfg, soc))
+
+
+def decode_wfg_sysctrl_reg_reset_flags(word):
+    return {"WFG": word & 0x1, "SOC": (word & 0x2) >> 1}
+
+
+def get_wfg_sysctrl_reg_reset_flags(sw):
+    return decode_wfg_sysctrl_reg_reset_flags(sw.readFPGARegister(WFG_SYSCTRL_REG_RESET_FLAGS_ADDR))
+
+
+WFG_SYSCTRL_REG_RESET_CLEARS_ADDR = 0x48024
+
+
+def encode_wfg_sysctrl_reg_reset_clears(wfg=0, soc=0):
+    return (wfg & 0x1) | ((soc << 1) & 0x2)
+
+
+def set_wfg_sysctrl_reg_reset_clears(sw, wfg=0, soc=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_RESET_CLEARS_ADDR, encode_wfg_sysctrl_reg_reset_clears(wfg, soc))
+
+
+def decode_wfg_sysctrl_reg_reset_clears(word):
+    return {"WFG": word & 0x1, "SOC": (word & 0x2) >> 1}
+
+
+def get_wfg_sysctrl_reg_reset_clears(sw):
+    return decode_wfg_sysctrl_reg_reset_clears(sw.readFPGARegister(WFG_SYSCTRL_REG_RESET_CLEARS_ADDR))
+
+
+WFG_SYSCTRL_REG_ISR_ADDR = 0x480a0
+
+
+def encode_wfg_sysctrl_reg_isr(wishbone_invalid_address=0):
+    return (wishbone_invalid_address & 0x1)
+
+
+def set_wfg_sysctrl_reg_isr(sw, wishbone_invalid_address=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_ISR_ADDR, encode_wfg_sysctrl_reg_isr(wishbone_invalid_address))
+
+
+def decode_wfg_sysctrl_reg_isr(word):
+    return {"WISHBONE_INVALID_ADDRESS": word & 0x1}
+
+
+def get_wfg_sysctrl_reg_isr(sw):
+    return decode_wfg_sysctrl_reg_isr(sw.readFPGARegister(WFG_SYSCTRL_REG_ISR_ADDR))
+
+
+WFG_SYSCTRL_REG_IER_ADDR = 0x480a4
+
+
+def encode_wfg_sysctrl_reg_ier(wishbone_invalid_address=0):
+    return (wishbone_invalid_address & 0x1)
+
+
+def set_wfg_sysctrl_reg_ier(sw, wishbone_invalid_address=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_IER_ADDR, encode_wfg_sysctrl_reg_ier(wishbone_invalid_address))
+
+
+def decode_wfg_sysctrl_reg_ier(word):
+    return {"WISHBONE_INVALID_ADDRESS": word & 0x1}
+
+
+def get_wfg_sysctrl_reg_ier(sw):
+    return decode_wfg_sysctrl_reg_ier(sw.readFPGARegister(WFG_SYSCTRL_REG_IER_ADDR))
+
+
+WFG_SYSCTRL_REG_ICR_ADDR = 0x480a8
+
+
+def encode_wfg_sysctrl_reg_icr(wishbone_invalid_address=0):
+    return (wishbone_invalid_address & 0x1)
+
+
+def set_wfg_sysctrl_reg_icr(sw, wishbone_invalid_address=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_ICR_ADDR, encode_wfg_sysctrl_reg_icr(wishbone_invalid_address))
+
+
+def decode_wfg_sysctrl_reg_icr(word):
+    return {"WISHBONE_INVALID_ADDRESS": word & 0x1}
+
+
+def get_wfg_sysctrl_reg_icr(sw):
+    return decode_wfg_sysctrl_reg_icr(sw.readFPGARegister(WFG_SYSCTRL_REG_ICR_ADDR))
+
+
+WFG_SYSCTRL_REG_INTERRUPT_MIRROR_ADDR = 0x480b0
+
+
+def encode_wfg_sysctrl_reg_interrupt_mirror(vector=0):
+    return (vector & 0xffffffff)
+
+
+def set_wfg_sysctrl_reg_interrupt_mirror(sw, vector=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_INTERRUPT_MIRROR_ADDR, encode_wfg_sysctrl_reg_interrupt_mirror(vector))
+
+
+def decode_wfg_sysctrl_reg_interrupt_mirror(word):
+    return {"VECTOR": word & 0xffffffff}
+
+
+def get_wfg_sysctrl_reg_interrupt_mirror(sw):
+    return decode_wfg_sysctrl_reg_interrupt_mirror(sw.readFPGARegister(WFG_SYSCTRL_REG_INTERRUPT_MIRROR_ADDR))
+
+
+WFG_SYSCTRL_REG_MODULE_INFO_ADDR = 0x480fc
+
+
+def encode_wfg_sysctrl_reg_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_sysctrl_reg_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_SYSCTRL_REG_MODULE_INFO_ADDR, encode_wfg_sysctrl_reg_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_sysctrl_reg_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_sysctrl_reg_module_info(sw):
+    return decode_wfg_sysctrl_reg_module_info(sw.readFPGARegister(WFG_SYSCTRL_REG_MODULE_INFO_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_CTRL_ADDR = 0x60000
+
+
+def encode_wfg_stim_mem_top_0_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_stim_mem_top_0_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_CTRL_ADDR, encode_wfg_stim_mem_top_0_ctrl(en))
+
+
+def decode_wfg_stim_mem_top_0_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_stim_mem_top_0_ctrl(sw):
+    return decode_wfg_stim_mem_top_0_ctrl(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_CTRL_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_CFG_ADDR = 0x60004
+
+
+def encode_wfg_stim_mem_top_0_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_stim_mem_top_0_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_CFG_ADDR, encode_wfg_stim_mem_top_0_cfg(cnt))
+
+
+def decode_wfg_stim_mem_top_0_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_stim_mem_top_0_cfg(sw):
+    return decode_wfg_stim_mem_top_0_cfg(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_CFG_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_START_ADDR = 0x60008
+
+
+def encode_wfg_stim_mem_top_0_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_0_start(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_START_ADDR, encode_wfg_stim_mem_top_0_start(val))
+
+
+def decode_wfg_stim_mem_top_0_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_0_start(sw):
+    return decode_wfg_stim_mem_top_0_start(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_START_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_STOP_ADDR = 0x6000c
+
+
+def encode_wfg_stim_mem_top_0_stop(val=0):
+    return (val & 0x3fff)
+
+
+def set_wfg_stim_mem_top_0_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_STOP_ADDR, encode_wfg_stim_mem_top_0_stop(val))
+
+
+def decode_wfg_stim_mem_top_0_stop(word):
+    return {"VAL": word & 0x3fff}
+
+
+def get_wfg_stim_mem_top_0_stop(sw):
+    return decode_wfg_stim_mem_top_0_stop(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_STOP_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_STEP_ADDR = 0x60010
+
+
+def encode_wfg_stim_mem_top_0_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_0_step(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_STEP_ADDR, encode_wfg_stim_mem_top_0_step(val))
+
+
+def decode_wfg_stim_mem_top_0_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_0_step(sw):
+    return decode_wfg_stim_mem_top_0_step(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_STEP_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_ADDR_ADDR = 0x60014
+
+
+def encode_wfg_stim_mem_top_0_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_0_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_ADDR_ADDR, encode_wfg_stim_mem_top_0_addr(val))
+
+
+def decode_wfg_stim_mem_top_0_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_0_addr(sw):
+    return decode_wfg_stim_mem_top_0_addr(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_ADDR_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_GAIN_ADDR = 0x60018
+
+
+def encode_wfg_stim_mem_top_0_gain(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_stim_mem_top_0_gain(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_GAIN_ADDR, encode_wfg_stim_mem_top_0_gain(val))
+
+
+def decode_wfg_stim_mem_top_0_gain(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_stim_mem_top_0_gain(sw):
+    return decode_wfg_stim_mem_top_0_gain(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_GAIN_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_OFFSET_ADDR = 0x6001c
+
+
+def encode_wfg_stim_mem_top_0_offset(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_stim_mem_top_0_offset(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_OFFSET_ADDR, encode_wfg_stim_mem_top_0_offset(val))
+
+
+def decode_wfg_stim_mem_top_0_offset(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_stim_mem_top_0_offset(sw):
+    return decode_wfg_stim_mem_top_0_offset(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_OFFSET_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_ISR_ADDR = 0x600a0
+
+
+def encode_wfg_stim_mem_top_0_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_0_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_ISR_ADDR, encode_wfg_stim_mem_top_0_isr(done, end))
+
+
+def decode_wfg_stim_mem_top_0_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_0_isr(sw):
+    return decode_wfg_stim_mem_top_0_isr(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_ISR_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_IER_ADDR = 0x600a4
+
+
+def encode_wfg_stim_mem_top_0_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_0_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_IER_ADDR, encode_wfg_stim_mem_top_0_ier(done, end))
+
+
+def decode_wfg_stim_mem_top_0_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_0_ier(sw):
+    return decode_wfg_stim_mem_top_0_ier(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_IER_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_ICR_ADDR = 0x600a8
+
+
+def encode_wfg_stim_mem_top_0_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_0_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_ICR_ADDR, encode_wfg_stim_mem_top_0_icr(done, end))
+
+
+def decode_wfg_stim_mem_top_0_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_0_icr(sw):
+    return decode_wfg_stim_mem_top_0_icr(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_ICR_ADDR))
+
+
+WFG_STIM_MEM_TOP_0_MODULE_INFO_ADDR = 0x600fc
+
+
+def encode_wfg_stim_mem_top_0_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_stim_mem_top_0_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_0_MODULE_INFO_ADDR, encode_wfg_stim_mem_top_0_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_stim_mem_top_0_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_stim_mem_top_0_module_info(sw):
+    return decode_wfg_stim_mem_top_0_module_info(sw.readFPGARegister(WFG_STIM_MEM_TOP_0_MODULE_INFO_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_CTRL_ADDR = 0x60100
+
+
+def encode_wfg_stim_mem_top_1_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_stim_mem_top_1_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_CTRL_ADDR, encode_wfg_stim_mem_top_1_ctrl(en))
+
+
+def decode_wfg_stim_mem_top_1_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_stim_mem_top_1_ctrl(sw):
+    return decode_wfg_stim_mem_top_1_ctrl(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_CTRL_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_CFG_ADDR = 0x60104
+
+
+def encode_wfg_stim_mem_top_1_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_stim_mem_top_1_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_CFG_ADDR, encode_wfg_stim_mem_top_1_cfg(cnt))
+
+
+def decode_wfg_stim_mem_top_1_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_stim_mem_top_1_cfg(sw):
+    return decode_wfg_stim_mem_top_1_cfg(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_CFG_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_START_ADDR = 0x60108
+
+
+def encode_wfg_stim_mem_top_1_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_1_start(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_START_ADDR, encode_wfg_stim_mem_top_1_start(val))
+
+
+def decode_wfg_stim_mem_top_1_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_1_start(sw):
+    return decode_wfg_stim_mem_top_1_start(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_START_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_STOP_ADDR = 0x6010c
+
+
+def encode_wfg_stim_mem_top_1_stop(val=0):
+    return (val & 0x3fff)
+
+
+def set_wfg_stim_mem_top_1_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_STOP_ADDR, encode_wfg_stim_mem_top_1_stop(val))
+
+
+def decode_wfg_stim_mem_top_1_stop(word):
+    return {"VAL": word & 0x3fff}
+
+
+def get_wfg_stim_mem_top_1_stop(sw):
+    return decode_wfg_stim_mem_top_1_stop(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_STOP_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_STEP_ADDR = 0x60110
+
+
+def encode_wfg_stim_mem_top_1_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_1_step(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_STEP_ADDR, encode_wfg_stim_mem_top_1_step(val))
+
+
+def decode_wfg_stim_mem_top_1_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_1_step(sw):
+    return decode_wfg_stim_mem_top_1_step(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_STEP_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_ADDR_ADDR = 0x60114
+
+
+def encode_wfg_stim_mem_top_1_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_1_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_ADDR_ADDR, encode_wfg_stim_mem_top_1_addr(val))
+
+
+def decode_wfg_stim_mem_top_1_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_1_addr(sw):
+    return decode_wfg_stim_mem_top_1_addr(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_ADDR_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_GAIN_ADDR = 0x60118
+
+
+def encode_wfg_stim_mem_top_1_gain(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_stim_mem_top_1_gain(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_GAIN_ADDR, encode_wfg_stim_mem_top_1_gain(val))
+
+
+def decode_wfg_stim_mem_top_1_gain(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_stim_mem_top_1_gain(sw):
+    return decode_wfg_stim_mem_top_1_gain(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_GAIN_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_OFFSET_ADDR = 0x6011c
+
+
+def encode_wfg_stim_mem_top_1_offset(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_stim_mem_top_1_offset(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_OFFSET_ADDR, encode_wfg_stim_mem_top_1_offset(val))
+
+
+def decode_wfg_stim_mem_top_1_offset(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_stim_mem_top_1_offset(sw):
+    return decode_wfg_stim_mem_top_1_offset(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_OFFSET_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_ISR_ADDR = 0x601a0
+
+
+def encode_wfg_stim_mem_top_1_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_1_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_ISR_ADDR, encode_wfg_stim_mem_top_1_isr(done, end))
+
+
+def decode_wfg_stim_mem_top_1_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_1_isr(sw):
+    return decode_wfg_stim_mem_top_1_isr(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_ISR_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_IER_ADDR = 0x601a4
+
+
+def encode_wfg_stim_mem_top_1_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_1_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_IER_ADDR, encode_wfg_stim_mem_top_1_ier(done, end))
+
+
+def decode_wfg_stim_mem_top_1_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_1_ier(sw):
+    return decode_wfg_stim_mem_top_1_ier(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_IER_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_ICR_ADDR = 0x601a8
+
+
+def encode_wfg_stim_mem_top_1_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_1_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_ICR_ADDR, encode_wfg_stim_mem_top_1_icr(done, end))
+
+
+def decode_wfg_stim_mem_top_1_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_1_icr(sw):
+    return decode_wfg_stim_mem_top_1_icr(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_ICR_ADDR))
+
+
+WFG_STIM_MEM_TOP_1_MODULE_INFO_ADDR = 0x601fc
+
+
+def encode_wfg_stim_mem_top_1_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_stim_mem_top_1_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_1_MODULE_INFO_ADDR, encode_wfg_stim_mem_top_1_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_stim_mem_top_1_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_stim_mem_top_1_module_info(sw):
+    return decode_wfg_stim_mem_top_1_module_info(sw.readFPGARegister(WFG_STIM_MEM_TOP_1_MODULE_INFO_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_CTRL_ADDR = 0x60200
+
+
+def encode_wfg_stim_mem_top_2_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_stim_mem_top_2_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_CTRL_ADDR, encode_wfg_stim_mem_top_2_ctrl(en))
+
+
+def decode_wfg_stim_mem_top_2_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_stim_mem_top_2_ctrl(sw):
+    return decode_wfg_stim_mem_top_2_ctrl(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_CTRL_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_CFG_ADDR = 0x60204
+
+
+def encode_wfg_stim_mem_top_2_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_stim_mem_top_2_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_CFG_ADDR, encode_wfg_stim_mem_top_2_cfg(cnt))
+
+
+def decode_wfg_stim_mem_top_2_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_stim_mem_top_2_cfg(sw):
+    return decode_wfg_stim_mem_top_2_cfg(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_CFG_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_START_ADDR = 0x60208
+
+
+def encode_wfg_stim_mem_top_2_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_2_start(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_START_ADDR, encode_wfg_stim_mem_top_2_start(val))
+
+
+def decode_wfg_stim_mem_top_2_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_2_start(sw):
+    return decode_wfg_stim_mem_top_2_start(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_START_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_STOP_ADDR = 0x6020c
+
+
+def encode_wfg_stim_mem_top_2_stop(val=0):
+    return (val & 0x3fff)
+
+
+def set_wfg_stim_mem_top_2_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_STOP_ADDR, encode_wfg_stim_mem_top_2_stop(val))
+
+
+def decode_wfg_stim_mem_top_2_stop(word):
+    return {"VAL": word & 0x3fff}
+
+
+def get_wfg_stim_mem_top_2_stop(sw):
+    return decode_wfg_stim_mem_top_2_stop(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_STOP_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_STEP_ADDR = 0x60210
+
+
+def encode_wfg_stim_mem_top_2_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_2_step(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_STEP_ADDR, encode_wfg_stim_mem_top_2_step(val))
+
+
+def decode_wfg_stim_mem_top_2_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_2_step(sw):
+    return decode_wfg_stim_mem_top_2_step(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_STEP_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_ADDR_ADDR = 0x60214
+
+
+def encode_wfg_stim_mem_top_2_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_2_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_ADDR_ADDR, encode_wfg_stim_mem_top_2_addr(val))
+
+
+def decode_wfg_stim_mem_top_2_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_2_addr(sw):
+    return decode_wfg_stim_mem_top_2_addr(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_ADDR_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_GAIN_ADDR = 0x60218
+
+
+def encode_wfg_stim_mem_top_2_gain(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_stim_mem_top_2_gain(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_GAIN_ADDR, encode_wfg_stim_mem_top_2_gain(val))
+
+
+def decode_wfg_stim_mem_top_2_gain(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_stim_mem_top_2_gain(sw):
+    return decode_wfg_stim_mem_top_2_gain(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_GAIN_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_OFFSET_ADDR = 0x6021c
+
+
+def encode_wfg_stim_mem_top_2_offset(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_stim_mem_top_2_offset(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_OFFSET_ADDR, encode_wfg_stim_mem_top_2_offset(val))
+
+
+def decode_wfg_stim_mem_top_2_offset(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_stim_mem_top_2_offset(sw):
+    return decode_wfg_stim_mem_top_2_offset(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_OFFSET_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_ISR_ADDR = 0x602a0
+
+
+def encode_wfg_stim_mem_top_2_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_2_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_ISR_ADDR, encode_wfg_stim_mem_top_2_isr(done, end))
+
+
+def decode_wfg_stim_mem_top_2_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_2_isr(sw):
+    return decode_wfg_stim_mem_top_2_isr(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_ISR_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_IER_ADDR = 0x602a4
+
+
+def encode_wfg_stim_mem_top_2_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_2_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_IER_ADDR, encode_wfg_stim_mem_top_2_ier(done, end))
+
+
+def decode_wfg_stim_mem_top_2_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_2_ier(sw):
+    return decode_wfg_stim_mem_top_2_ier(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_IER_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_ICR_ADDR = 0x602a8
+
+
+def encode_wfg_stim_mem_top_2_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_2_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_ICR_ADDR, encode_wfg_stim_mem_top_2_icr(done, end))
+
+
+def decode_wfg_stim_mem_top_2_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_2_icr(sw):
+    return decode_wfg_stim_mem_top_2_icr(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_ICR_ADDR))
+
+
+WFG_STIM_MEM_TOP_2_MODULE_INFO_ADDR = 0x602fc
+
+
+def encode_wfg_stim_mem_top_2_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_stim_mem_top_2_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_2_MODULE_INFO_ADDR, encode_wfg_stim_mem_top_2_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_stim_mem_top_2_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_stim_mem_top_2_module_info(sw):
+    return decode_wfg_stim_mem_top_2_module_info(sw.readFPGARegister(WFG_STIM_MEM_TOP_2_MODULE_INFO_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_CTRL_ADDR = 0x60300
+
+
+def encode_wfg_stim_mem_top_3_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_stim_mem_top_3_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_CTRL_ADDR, encode_wfg_stim_mem_top_3_ctrl(en))
+
+
+def decode_wfg_stim_mem_top_3_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_stim_mem_top_3_ctrl(sw):
+    return decode_wfg_stim_mem_top_3_ctrl(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_CTRL_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_CFG_ADDR = 0x60304
+
+
+def encode_wfg_stim_mem_top_3_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_stim_mem_top_3_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_CFG_ADDR, encode_wfg_stim_mem_top_3_cfg(cnt))
+
+
+def decode_wfg_stim_mem_top_3_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_stim_mem_top_3_cfg(sw):
+    return decode_wfg_stim_mem_top_3_cfg(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_CFG_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_START_ADDR = 0x60308
+
+
+def encode_wfg_stim_mem_top_3_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_3_start(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_START_ADDR, encode_wfg_stim_mem_top_3_start(val))
+
+
+def decode_wfg_stim_mem_top_3_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_3_start(sw):
+    return decode_wfg_stim_mem_top_3_start(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_START_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_STOP_ADDR = 0x6030c
+
+
+def encode_wfg_stim_mem_top_3_stop(val=0):
+    return (val & 0x3fff)
+
+
+def set_wfg_stim_mem_top_3_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_STOP_ADDR, encode_wfg_stim_mem_top_3_stop(val))
+
+
+def decode_wfg_stim_mem_top_3_stop(word):
+    return {"VAL": word & 0x3fff}
+
+
+def get_wfg_stim_mem_top_3_stop(sw):
+    return decode_wfg_stim_mem_top_3_stop(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_STOP_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_STEP_ADDR = 0x60310
+
+
+def encode_wfg_stim_mem_top_3_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_3_step(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_STEP_ADDR, encode_wfg_stim_mem_top_3_step(val))
+
+
+def decode_wfg_stim_mem_top_3_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_3_step(sw):
+    return decode_wfg_stim_mem_top_3_step(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_STEP_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_ADDR_ADDR = 0x60314
+
+
+def encode_wfg_stim_mem_top_3_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_stim_mem_top_3_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_ADDR_ADDR, encode_wfg_stim_mem_top_3_addr(val))
+
+
+def decode_wfg_stim_mem_top_3_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_stim_mem_top_3_addr(sw):
+    return decode_wfg_stim_mem_top_3_addr(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_ADDR_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_GAIN_ADDR = 0x60318
+
+
+def encode_wfg_stim_mem_top_3_gain(val=0):
+    return (val & 0xffff)
+
+
+def set_wfg_stim_mem_top_3_gain(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_GAIN_ADDR, encode_wfg_stim_mem_top_3_gain(val))
+
+
+def decode_wfg_stim_mem_top_3_gain(word):
+    return {"VAL": word & 0xffff}
+
+
+def get_wfg_stim_mem_top_3_gain(sw):
+    return decode_wfg_stim_mem_top_3_gain(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_GAIN_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_OFFSET_ADDR = 0x6031c
+
+
+def encode_wfg_stim_mem_top_3_offset(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_stim_mem_top_3_offset(sw, val=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_OFFSET_ADDR, encode_wfg_stim_mem_top_3_offset(val))
+
+
+def decode_wfg_stim_mem_top_3_offset(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_stim_mem_top_3_offset(sw):
+    return decode_wfg_stim_mem_top_3_offset(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_OFFSET_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_ISR_ADDR = 0x603a0
+
+
+def encode_wfg_stim_mem_top_3_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_3_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_ISR_ADDR, encode_wfg_stim_mem_top_3_isr(done, end))
+
+
+def decode_wfg_stim_mem_top_3_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_3_isr(sw):
+    return decode_wfg_stim_mem_top_3_isr(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_ISR_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_IER_ADDR = 0x603a4
+
+
+def encode_wfg_stim_mem_top_3_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_3_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_IER_ADDR, encode_wfg_stim_mem_top_3_ier(done, end))
+
+
+def decode_wfg_stim_mem_top_3_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_3_ier(sw):
+    return decode_wfg_stim_mem_top_3_ier(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_IER_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_ICR_ADDR = 0x603a8
+
+
+def encode_wfg_stim_mem_top_3_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_stim_mem_top_3_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_ICR_ADDR, encode_wfg_stim_mem_top_3_icr(done, end))
+
+
+def decode_wfg_stim_mem_top_3_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_stim_mem_top_3_icr(sw):
+    return decode_wfg_stim_mem_top_3_icr(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_ICR_ADDR))
+
+
+WFG_STIM_MEM_TOP_3_MODULE_INFO_ADDR = 0x603fc
+
+
+def encode_wfg_stim_mem_top_3_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_stim_mem_top_3_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_STIM_MEM_TOP_3_MODULE_INFO_ADDR, encode_wfg_stim_mem_top_3_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_stim_mem_top_3_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_stim_mem_top_3_module_info(sw):
+    return decode_wfg_stim_mem_top_3_module_info(sw.readFPGARegister(WFG_STIM_MEM_TOP_3_MODULE_INFO_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_0_CTRL_ADDR = 0x80000
+
+
+def encode_wfg_drive_spi_top_0_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_drive_spi_top_0_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_0_CTRL_ADDR, encode_wfg_drive_spi_top_0_ctrl(en))
+
+
+def decode_wfg_drive_spi_top_0_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_drive_spi_top_0_ctrl(sw):
+    return decode_wfg_drive_spi_top_0_ctrl(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_0_CTRL_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_0_CFG_ADDR = 0x80004
+
+
+def encode_wfg_drive_spi_top_0_cfg(cpol=0, cpha=0, lsbfirst=0, sspol=0, core_sel=0, core_dependent=0, io_delay_compensation=0):
+    return (cpol & 0x1) | ((cpha << 1) & 0x2) | ((lsbfirst << 2) & 0x4) | ((sspol << 3) & 0x8) | ((core_sel << 4) & 0x10) | ((core_dependent << 5) & 0x20) | ((io_delay_compensation << 6) & 0x1c0)
+
+
+def set_wfg_drive_spi_top_0_cfg(sw, cpol=0, cpha=0, lsbfirst=0, sspol=0, core_sel=0, core_dependent=0, io_delay_compensation=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_0_CFG_ADDR, encode_wfg_drive_spi_top_0_cfg(cpol, cpha, lsbfirst, sspol, core_sel, core_dependent, io_delay_compensation))
+
+
+def decode_wfg_drive_spi_top_0_cfg(word):
+    return {"CPOL": word & 0x1, "CPHA": (word & 0x2) >> 1, "LSBFIRST": (word & 0x4) >> 2, "SSPOL": (word & 0x8) >> 3, "CORE_SEL": (word & 0x10) >> 4, "CORE_DEPENDENT": (word & 0x20) >> 5, "IO_DELAY_COMPENSATION": (word & 0x1c0) >> 6}
+
+
+def get_wfg_drive_spi_top_0_cfg(sw):
+    return decode_wfg_drive_spi_top_0_cfg(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_0_CFG_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_0_CLKCFG_ADDR = 0x80008
+
+
+def encode_wfg_drive_spi_top_0_clkcfg(div=0):
+    return (div & 0xffffffff)
+
+
+def set_wfg_drive_spi_top_0_clkcfg(sw, div=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_0_CLKCFG_ADDR, encode_wfg_drive_spi_top_0_clkcfg(div))
+
+
+def decode_wfg_drive_spi_top_0_clkcfg(word):
+    return {"DIV": word & 0xffffffff}
+
+
+def get_wfg_drive_spi_top_0_clkcfg(sw):
+    return decode_wfg_drive_spi_top_0_clkcfg(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_0_CLKCFG_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_0_SPI_LEN_ADDR = 0x8000c
+
+
+def encode_wfg_drive_spi_top_0_spi_len(val=0):
+    return (val & 0x3f)
+
+
+def set_wfg_drive_spi_top_0_spi_len(sw, val=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_0_SPI_LEN_ADDR, encode_wfg_drive_spi_top_0_spi_len(val))
+
+
+def decode_wfg_drive_spi_top_0_spi_len(word):
+    return {"VAL": word & 0x3f}
+
+
+def get_wfg_drive_spi_top_0_spi_len(sw):
+    return decode_wfg_drive_spi_top_0_spi_len(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_0_SPI_LEN_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_0_CS_HIGH_TIME_ADDR = 0x80010
+
+
+def encode_wfg_drive_spi_top_0_cs_high_time(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_drive_spi_top_0_cs_high_time(sw, val=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_0_CS_HIGH_TIME_ADDR, encode_wfg_drive_spi_top_0_cs_high_time(val))
+
+
+def decode_wfg_drive_spi_top_0_cs_high_time(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_drive_spi_top_0_cs_high_time(sw):
+    return decode_wfg_drive_spi_top_0_cs_high_time(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_0_CS_HIGH_TIME_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_0_CS_ACTIVE_DELAY_TIME_ADDR = 0x80014
+
+
+def encode_wfg_drive_spi_top_0_cs_active_delay_time(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_drive_spi_top_0_cs_active_delay_time(sw, val=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_0_CS_ACTIVE_DELAY_TIME_ADDR, encode_wfg_drive_spi_top_0_cs_active_delay_time(val))
+
+
+def decode_wfg_drive_spi_top_0_cs_active_delay_time(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_drive_spi_top_0_cs_active_delay_time(sw):
+    return decode_wfg_drive_spi_top_0_cs_active_delay_time(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_0_CS_ACTIVE_DELAY_TIME_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_0_MODULE_INFO_ADDR = 0x800fc
+
+
+def encode_wfg_drive_spi_top_0_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_drive_spi_top_0_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_0_MODULE_INFO_ADDR, encode_wfg_drive_spi_top_0_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_drive_spi_top_0_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_drive_spi_top_0_module_info(sw):
+    return decode_wfg_drive_spi_top_0_module_info(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_0_MODULE_INFO_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_1_CTRL_ADDR = 0x80100
+
+
+def encode_wfg_drive_spi_top_1_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_drive_spi_top_1_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_1_CTRL_ADDR, encode_wfg_drive_spi_top_1_ctrl(en))
+
+
+def decode_wfg_drive_spi_top_1_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_drive_spi_top_1_ctrl(sw):
+    return decode_wfg_drive_spi_top_1_ctrl(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_1_CTRL_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_1_CFG_ADDR = 0x80104
+
+
+def encode_wfg_drive_spi_top_1_cfg(cpol=0, cpha=0, lsbfirst=0, sspol=0, core_sel=0, core_dependent=0, io_delay_compensation=0):
+    return (cpol & 0x1) | ((cpha << 1) & 0x2) | ((lsbfirst << 2) & 0x4) | ((sspol << 3) & 0x8) | ((core_sel << 4) & 0x10) | ((core_dependent << 5) & 0x20) | ((io_delay_compensation << 6) & 0x1c0)
+
+
+def set_wfg_drive_spi_top_1_cfg(sw, cpol=0, cpha=0, lsbfirst=0, sspol=0, core_sel=0, core_dependent=0, io_delay_compensation=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_1_CFG_ADDR, encode_wfg_drive_spi_top_1_cfg(cpol, cpha, lsbfirst, sspol, core_sel, core_dependent, io_delay_compensation))
+
+
+def decode_wfg_drive_spi_top_1_cfg(word):
+    return {"CPOL": word & 0x1, "CPHA": (word & 0x2) >> 1, "LSBFIRST": (word & 0x4) >> 2, "SSPOL": (word & 0x8) >> 3, "CORE_SEL": (word & 0x10) >> 4, "CORE_DEPENDENT": (word & 0x20) >> 5, "IO_DELAY_COMPENSATION": (word & 0x1c0) >> 6}
+
+
+def get_wfg_drive_spi_top_1_cfg(sw):
+    return decode_wfg_drive_spi_top_1_cfg(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_1_CFG_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_1_CLKCFG_ADDR = 0x80108
+
+
+def encode_wfg_drive_spi_top_1_clkcfg(div=0):
+    return (div & 0xffffffff)
+
+
+def set_wfg_drive_spi_top_1_clkcfg(sw, div=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_1_CLKCFG_ADDR, encode_wfg_drive_spi_top_1_clkcfg(div))
+
+
+def decode_wfg_drive_spi_top_1_clkcfg(word):
+    return {"DIV": word & 0xffffffff}
+
+
+def get_wfg_drive_spi_top_1_clkcfg(sw):
+    return decode_wfg_drive_spi_top_1_clkcfg(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_1_CLKCFG_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_1_SPI_LEN_ADDR = 0x8010c
+
+
+def encode_wfg_drive_spi_top_1_spi_len(val=0):
+    return (val & 0x3f)
+
+
+def set_wfg_drive_spi_top_1_spi_len(sw, val=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_1_SPI_LEN_ADDR, encode_wfg_drive_spi_top_1_spi_len(val))
+
+
+def decode_wfg_drive_spi_top_1_spi_len(word):
+    return {"VAL": word & 0x3f}
+
+
+def get_wfg_drive_spi_top_1_spi_len(sw):
+    return decode_wfg_drive_spi_top_1_spi_len(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_1_SPI_LEN_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_1_CS_HIGH_TIME_ADDR = 0x80110
+
+
+def encode_wfg_drive_spi_top_1_cs_high_time(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_drive_spi_top_1_cs_high_time(sw, val=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_1_CS_HIGH_TIME_ADDR, encode_wfg_drive_spi_top_1_cs_high_time(val))
+
+
+def decode_wfg_drive_spi_top_1_cs_high_time(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_drive_spi_top_1_cs_high_time(sw):
+    return decode_wfg_drive_spi_top_1_cs_high_time(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_1_CS_HIGH_TIME_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_1_CS_ACTIVE_DELAY_TIME_ADDR = 0x80114
+
+
+def encode_wfg_drive_spi_top_1_cs_active_delay_time(val=0):
+    return (val & 0xffffffff)
+
+
+def set_wfg_drive_spi_top_1_cs_active_delay_time(sw, val=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_1_CS_ACTIVE_DELAY_TIME_ADDR, encode_wfg_drive_spi_top_1_cs_active_delay_time(val))
+
+
+def decode_wfg_drive_spi_top_1_cs_active_delay_time(word):
+    return {"VAL": word & 0xffffffff}
+
+
+def get_wfg_drive_spi_top_1_cs_active_delay_time(sw):
+    return decode_wfg_drive_spi_top_1_cs_active_delay_time(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_1_CS_ACTIVE_DELAY_TIME_ADDR))
+
+
+WFG_DRIVE_SPI_TOP_1_MODULE_INFO_ADDR = 0x801fc
+
+
+def encode_wfg_drive_spi_top_1_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_drive_spi_top_1_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_DRIVE_SPI_TOP_1_MODULE_INFO_ADDR, encode_wfg_drive_spi_top_1_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_drive_spi_top_1_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_drive_spi_top_1_module_info(sw):
+    return decode_wfg_drive_spi_top_1_module_info(sw.readFPGARegister(WFG_DRIVE_SPI_TOP_1_MODULE_INFO_ADDR))
+
+
+WFG_DRIVE_PAT_TOP_0_CTRL_ADDR = 0x82000
+
+
+def encode_wfg_drive_pat_top_0_ctrl(en=0):
+    return (en & 0xffff)
+
+
+def set_wfg_drive_pat_top_0_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_PAT_TOP_0_CTRL_ADDR, encode_wfg_drive_pat_top_0_ctrl(en))
+
+
+def decode_wfg_drive_pat_top_0_ctrl(word):
+    return {"EN": word & 0xffff}
+
+
+def get_wfg_drive_pat_top_0_ctrl(sw):
+    return decode_wfg_drive_pat_top_0_ctrl(sw.readFPGARegister(WFG_DRIVE_PAT_TOP_0_CTRL_ADDR))
+
+
+WFG_DRIVE_PAT_TOP_0_CFG_ADDR = 0x82004
+
+
+def encode_wfg_drive_pat_top_0_cfg(begin=0, end=0, core_sel=0):
+    return (begin & 0xff) | ((end << 8) & 0xff00) | ((core_sel << 16) & 0x10000)
+
+
+def set_wfg_drive_pat_top_0_cfg(sw, begin=0, end=0, core_sel=0):
+    sw.writeFPGARegister(WFG_DRIVE_PAT_TOP_0_CFG_ADDR, encode_wfg_drive_pat_top_0_cfg(begin, end, core_sel))
+
+
+def decode_wfg_drive_pat_top_0_cfg(word):
+    return {"BEGIN": word & 0xff, "END": (word & 0xff00) >> 8, "CORE_SEL": (word & 0x10000) >> 16}
+
+
+def get_wfg_drive_pat_top_0_cfg(sw):
+    return decode_wfg_drive_pat_top_0_cfg(sw.readFPGARegister(WFG_DRIVE_PAT_TOP_0_CFG_ADDR))
+
+
+WFG_DRIVE_PAT_TOP_0_PATSEL0_ADDR = 0x82008
+
+
+def encode_wfg_drive_pat_top_0_patsel0(low=0):
+    return (low & 0xffff)
+
+
+def set_wfg_drive_pat_top_0_patsel0(sw, low=0):
+    sw.writeFPGARegister(WFG_DRIVE_PAT_TOP_0_PATSEL0_ADDR, encode_wfg_drive_pat_top_0_patsel0(low))
+
+
+def decode_wfg_drive_pat_top_0_patsel0(word):
+    return {"LOW": word & 0xffff}
+
+
+def get_wfg_drive_pat_top_0_patsel0(sw):
+    return decode_wfg_drive_pat_top_0_patsel0(sw.readFPGARegister(WFG_DRIVE_PAT_TOP_0_PATSEL0_ADDR))
+
+
+WFG_DRIVE_PAT_TOP_0_PATSEL1_ADDR = 0x8200c
+
+
+def encode_wfg_drive_pat_top_0_patsel1(high=0):
+    return (high & 0xffff)
+
+
+def set_wfg_drive_pat_top_0_patsel1(sw, high=0):
+    sw.writeFPGARegister(WFG_DRIVE_PAT_TOP_0_PATSEL1_ADDR, encode_wfg_drive_pat_top_0_patsel1(high))
+
+
+def decode_wfg_drive_pat_top_0_patsel1(word):
+    return {"HIGH": word & 0xffff}
+
+
+def get_wfg_drive_pat_top_0_patsel1(sw):
+    return decode_wfg_drive_pat_top_0_patsel1(sw.readFPGARegister(WFG_DRIVE_PAT_TOP_0_PATSEL1_ADDR))
+
+
+WFG_DRIVE_PAT_TOP_0_MODULE_INFO_ADDR = 0x820fc
+
+
+def encode_wfg_drive_pat_top_0_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_drive_pat_top_0_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_DRIVE_PAT_TOP_0_MODULE_INFO_ADDR, encode_wfg_drive_pat_top_0_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_drive_pat_top_0_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_drive_pat_top_0_module_info(sw):
+    return decode_wfg_drive_pat_top_0_module_info(sw.readFPGARegister(WFG_DRIVE_PAT_TOP_0_MODULE_INFO_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_0_CTRL_ADDR = 0x84000
+
+
+def encode_wfg_drive_i2c_top_0_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_drive_i2c_top_0_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_0_CTRL_ADDR, encode_wfg_drive_i2c_top_0_ctrl(en))
+
+
+def decode_wfg_drive_i2c_top_0_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_drive_i2c_top_0_ctrl(sw):
+    return decode_wfg_drive_i2c_top_0_ctrl(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_0_CTRL_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_0_CFG_ADDR = 0x84004
+
+
+def encode_wfg_drive_i2c_top_0_cfg(dev_id=0, wait_state_enabled=0, core_sel=0, core_dependent=0):
+    return (dev_id & 0x7f) | ((wait_state_enabled << 8) & 0x100) | ((core_sel << 16) & 0x10000) | ((core_dependent << 17) & 0x20000)
+
+
+def set_wfg_drive_i2c_top_0_cfg(sw, dev_id=0, wait_state_enabled=0, core_sel=0, core_dependent=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_0_CFG_ADDR, encode_wfg_drive_i2c_top_0_cfg(dev_id, wait_state_enabled, core_sel, core_dependent))
+
+
+def decode_wfg_drive_i2c_top_0_cfg(word):
+    return {"DEV_ID": word & 0x7f, "WAIT_STATE_ENABLED": (word & 0x100) >> 8, "CORE_SEL": (word & 0x10000) >> 16, "CORE_DEPENDENT": (word & 0x20000) >> 17}
+
+
+def get_wfg_drive_i2c_top_0_cfg(sw):
+    return decode_wfg_drive_i2c_top_0_cfg(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_0_CFG_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_0_CLKCFG_ADDR = 0x84008
+
+
+def encode_wfg_drive_i2c_top_0_clkcfg(div=0):
+    return (div & 0xffffffff)
+
+
+def set_wfg_drive_i2c_top_0_clkcfg(sw, div=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_0_CLKCFG_ADDR, encode_wfg_drive_i2c_top_0_clkcfg(div))
+
+
+def decode_wfg_drive_i2c_top_0_clkcfg(word):
+    return {"DIV": word & 0xffffffff}
+
+
+def get_wfg_drive_i2c_top_0_clkcfg(sw):
+    return decode_wfg_drive_i2c_top_0_clkcfg(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_0_CLKCFG_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_0_ISR_ADDR = 0x840a0
+
+
+def encode_wfg_drive_i2c_top_0_isr(command_frame_error=0, data_frame_error=0):
+    return (command_frame_error & 0x1) | ((data_frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_i2c_top_0_isr(sw, command_frame_error=0, data_frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_0_ISR_ADDR, encode_wfg_drive_i2c_top_0_isr(command_frame_error, data_frame_error))
+
+
+def decode_wfg_drive_i2c_top_0_isr(word):
+    return {"COMMAND_FRAME_ERROR": word & 0x1, "DATA_FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_i2c_top_0_isr(sw):
+    return decode_wfg_drive_i2c_top_0_isr(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_0_ISR_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_0_IER_ADDR = 0x840a4
+
+
+def encode_wfg_drive_i2c_top_0_ier(command_frame_error=0, data_frame_error=0):
+    return (command_frame_error & 0x1) | ((data_frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_i2c_top_0_ier(sw, command_frame_error=0, data_frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_0_IER_ADDR, encode_wfg_drive_i2c_top_0_ier(command_frame_error, data_frame_error))
+
+
+def decode_wfg_drive_i2c_top_0_ier(word):
+    return {"COMMAND_FRAME_ERROR": word & 0x1, "DATA_FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_i2c_top_0_ier(sw):
+    return decode_wfg_drive_i2c_top_0_ier(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_0_IER_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_0_ICR_ADDR = 0x840a8
+
+
+def encode_wfg_drive_i2c_top_0_icr(command_frame_error=0, data_frame_error=0):
+    return (command_frame_error & 0x1) | ((data_frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_i2c_top_0_icr(sw, command_frame_error=0, data_frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_0_ICR_ADDR, encode_wfg_drive_i2c_top_0_icr(command_frame_error, data_frame_error))
+
+
+def decode_wfg_drive_i2c_top_0_icr(word):
+    return {"COMMAND_FRAME_ERROR": word & 0x1, "DATA_FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_i2c_top_0_icr(sw):
+    return decode_wfg_drive_i2c_top_0_icr(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_0_ICR_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_0_MODULE_INFO_ADDR = 0x840fc
+
+
+def encode_wfg_drive_i2c_top_0_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_drive_i2c_top_0_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_0_MODULE_INFO_ADDR, encode_wfg_drive_i2c_top_0_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_drive_i2c_top_0_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_drive_i2c_top_0_module_info(sw):
+    return decode_wfg_drive_i2c_top_0_module_info(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_0_MODULE_INFO_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_1_CTRL_ADDR = 0x84100
+
+
+def encode_wfg_drive_i2c_top_1_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_drive_i2c_top_1_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_1_CTRL_ADDR, encode_wfg_drive_i2c_top_1_ctrl(en))
+
+
+def decode_wfg_drive_i2c_top_1_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_drive_i2c_top_1_ctrl(sw):
+    return decode_wfg_drive_i2c_top_1_ctrl(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_1_CTRL_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_1_CFG_ADDR = 0x84104
+
+
+def encode_wfg_drive_i2c_top_1_cfg(dev_id=0, wait_state_enabled=0, core_sel=0, core_dependent=0):
+    return (dev_id & 0x7f) | ((wait_state_enabled << 8) & 0x100) | ((core_sel << 16) & 0x10000) | ((core_dependent << 17) & 0x20000)
+
+
+def set_wfg_drive_i2c_top_1_cfg(sw, dev_id=0, wait_state_enabled=0, core_sel=0, core_dependent=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_1_CFG_ADDR, encode_wfg_drive_i2c_top_1_cfg(dev_id, wait_state_enabled, core_sel, core_dependent))
+
+
+def decode_wfg_drive_i2c_top_1_cfg(word):
+    return {"DEV_ID": word & 0x7f, "WAIT_STATE_ENABLED": (word & 0x100) >> 8, "CORE_SEL": (word & 0x10000) >> 16, "CORE_DEPENDENT": (word & 0x20000) >> 17}
+
+
+def get_wfg_drive_i2c_top_1_cfg(sw):
+    return decode_wfg_drive_i2c_top_1_cfg(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_1_CFG_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_1_CLKCFG_ADDR = 0x84108
+
+
+def encode_wfg_drive_i2c_top_1_clkcfg(div=0):
+    return (div & 0xffffffff)
+
+
+def set_wfg_drive_i2c_top_1_clkcfg(sw, div=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_1_CLKCFG_ADDR, encode_wfg_drive_i2c_top_1_clkcfg(div))
+
+
+def decode_wfg_drive_i2c_top_1_clkcfg(word):
+    return {"DIV": word & 0xffffffff}
+
+
+def get_wfg_drive_i2c_top_1_clkcfg(sw):
+    return decode_wfg_drive_i2c_top_1_clkcfg(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_1_CLKCFG_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_1_ISR_ADDR = 0x841a0
+
+
+def encode_wfg_drive_i2c_top_1_isr(command_frame_error=0, data_frame_error=0):
+    return (command_frame_error & 0x1) | ((data_frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_i2c_top_1_isr(sw, command_frame_error=0, data_frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_1_ISR_ADDR, encode_wfg_drive_i2c_top_1_isr(command_frame_error, data_frame_error))
+
+
+def decode_wfg_drive_i2c_top_1_isr(word):
+    return {"COMMAND_FRAME_ERROR": word & 0x1, "DATA_FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_i2c_top_1_isr(sw):
+    return decode_wfg_drive_i2c_top_1_isr(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_1_ISR_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_1_IER_ADDR = 0x841a4
+
+
+def encode_wfg_drive_i2c_top_1_ier(command_frame_error=0, data_frame_error=0):
+    return (command_frame_error & 0x1) | ((data_frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_i2c_top_1_ier(sw, command_frame_error=0, data_frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_1_IER_ADDR, encode_wfg_drive_i2c_top_1_ier(command_frame_error, data_frame_error))
+
+
+def decode_wfg_drive_i2c_top_1_ier(word):
+    return {"COMMAND_FRAME_ERROR": word & 0x1, "DATA_FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_i2c_top_1_ier(sw):
+    return decode_wfg_drive_i2c_top_1_ier(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_1_IER_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_1_ICR_ADDR = 0x841a8
+
+
+def encode_wfg_drive_i2c_top_1_icr(command_frame_error=0, data_frame_error=0):
+    return (command_frame_error & 0x1) | ((data_frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_i2c_top_1_icr(sw, command_frame_error=0, data_frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_1_ICR_ADDR, encode_wfg_drive_i2c_top_1_icr(command_frame_error, data_frame_error))
+
+
+def decode_wfg_drive_i2c_top_1_icr(word):
+    return {"COMMAND_FRAME_ERROR": word & 0x1, "DATA_FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_i2c_top_1_icr(sw):
+    return decode_wfg_drive_i2c_top_1_icr(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_1_ICR_ADDR))
+
+
+WFG_DRIVE_I2C_TOP_1_MODULE_INFO_ADDR = 0x841fc
+
+
+def encode_wfg_drive_i2c_top_1_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_drive_i2c_top_1_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2C_TOP_1_MODULE_INFO_ADDR, encode_wfg_drive_i2c_top_1_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_drive_i2c_top_1_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_drive_i2c_top_1_module_info(sw):
+    return decode_wfg_drive_i2c_top_1_module_info(sw.readFPGARegister(WFG_DRIVE_I2C_TOP_1_MODULE_INFO_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_CTRL_ADDR = 0x88000
+
+
+def encode_wfg_drive_i2ct_top_0_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_drive_i2ct_top_0_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_CTRL_ADDR, encode_wfg_drive_i2ct_top_0_ctrl(en))
+
+
+def decode_wfg_drive_i2ct_top_0_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_drive_i2ct_top_0_ctrl(sw):
+    return decode_wfg_drive_i2ct_top_0_ctrl(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_CTRL_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_CFG_ADDR = 0x88004
+
+
+def encode_wfg_drive_i2ct_top_0_cfg(devid=0, addrsize=0, datasize=0):
+    return ((devid << 1) & 0xfe) | ((addrsize << 8) & 0x100) | ((datasize << 16) & 0x30000)
+
+
+def set_wfg_drive_i2ct_top_0_cfg(sw, devid=0, addrsize=0, datasize=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_CFG_ADDR, encode_wfg_drive_i2ct_top_0_cfg(devid, addrsize, datasize))
+
+
+def decode_wfg_drive_i2ct_top_0_cfg(word):
+    return {"DEVID": (word & 0xfe) >> 1, "ADDRSIZE": (word & 0x100) >> 8, "DATASIZE": (word & 0x30000) >> 16}
+
+
+def get_wfg_drive_i2ct_top_0_cfg(sw):
+    return decode_wfg_drive_i2ct_top_0_cfg(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_CFG_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_REGCFG_ADDR = 0x88010
+
+
+def encode_wfg_drive_i2ct_top_0_regcfg(autoinc=0):
+    return (autoinc & 0x1)
+
+
+def set_wfg_drive_i2ct_top_0_regcfg(sw, autoinc=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGCFG_ADDR, encode_wfg_drive_i2ct_top_0_regcfg(autoinc))
+
+
+def decode_wfg_drive_i2ct_top_0_regcfg(word):
+    return {"AUTOINC": word & 0x1}
+
+
+def get_wfg_drive_i2ct_top_0_regcfg(sw):
+    return decode_wfg_drive_i2ct_top_0_regcfg(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGCFG_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_REGADDR_ADDR = 0x88014
+
+
+def encode_wfg_drive_i2ct_top_0_regaddr(addr=0):
+    return (addr & 0xffff)
+
+
+def set_wfg_drive_i2ct_top_0_regaddr(sw, addr=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGADDR_ADDR, encode_wfg_drive_i2ct_top_0_regaddr(addr))
+
+
+def decode_wfg_drive_i2ct_top_0_regaddr(word):
+    return {"ADDR": word & 0xffff}
+
+
+def get_wfg_drive_i2ct_top_0_regaddr(sw):
+    return decode_wfg_drive_i2ct_top_0_regaddr(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGADDR_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR = 0x88018
+
+
+def encode_wfg_drive_i2ct_top_0_regwdata(data=0):
+    return (data & 0xffffffff)
+
+
+def set_wfg_drive_i2ct_top_0_regwdata(sw, data=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR, encode_wfg_drive_i2ct_top_0_regwdata(data))
+
+
+def decode_wfg_drive_i2ct_top_0_regwdata(word):
+    return {"DATA": word & 0xffffffff}
+
+
+def get_wfg_drive_i2ct_top_0_regwdata(sw):
+    return decode_wfg_drive_i2ct_top_0_regwdata(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_REGWMASK_ADDR = 0x8801c
+
+
+def encode_wfg_drive_i2ct_top_0_regwmask(mask=0):
+    return (mask & 0xffffffff)
+
+
+def set_wfg_drive_i2ct_top_0_regwmask(sw, mask=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGWMASK_ADDR, encode_wfg_drive_i2ct_top_0_regwmask(mask))
+
+
+def decode_wfg_drive_i2ct_top_0_regwmask(word):
+    return {"MASK": word & 0xffffffff}
+
+
+def get_wfg_drive_i2ct_top_0_regwmask(sw):
+    return decode_wfg_drive_i2ct_top_0_regwmask(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGWMASK_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_REGRDATA_ADDR = 0x88020
+
+
+def encode_wfg_drive_i2ct_top_0_regrdata(data=0):
+    return (data & 0xffffffff)
+
+
+def set_wfg_drive_i2ct_top_0_regrdata(sw, data=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGRDATA_ADDR, encode_wfg_drive_i2ct_top_0_regrdata(data))
+
+
+def decode_wfg_drive_i2ct_top_0_regrdata(word):
+    return {"DATA": word & 0xffffffff}
+
+
+def get_wfg_drive_i2ct_top_0_regrdata(sw):
+    return decode_wfg_drive_i2ct_top_0_regrdata(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGRDATA_ADDR))
+
+
+WFG_DRIVE_I2CT_TOP_0_REGRMASK_ADDR = 0x88024
+
+
+def encode_wfg_drive_i2ct_top_0_regrmask(mask=0):
+    return (mask & 0xffffffff)
+
+
+def set_wfg_drive_i2ct_top_0_regrmask(sw, mask=0):
+    sw.writeFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGRMASK_ADDR, encode_wfg_drive_i2ct_top_0_regrmask(mask))
+
+
+def decode_wfg_drive_i2ct_top_0_regrmask(word):
+    return {"MASK": word & 0xffffffff}
+
+
+def get_wfg_drive_i2ct_top_0_regrmask(sw):
+    return decode_wfg_drive_i2ct_top_0_regrmask(sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGRMASK_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_CTRL_ADDR = 0x86000
+
+
+def encode_wfg_drive_uart_top_0_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_drive_uart_top_0_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_CTRL_ADDR, encode_wfg_drive_uart_top_0_ctrl(en))
+
+
+def decode_wfg_drive_uart_top_0_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_drive_uart_top_0_ctrl(sw):
+    return decode_wfg_drive_uart_top_0_ctrl(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_CTRL_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_CFG_ADDR = 0x86004
+
+
+def encode_wfg_drive_uart_top_0_cfg(core_sel=0, txsize=0, core_dependent=0, cdiv=0):
+    return (core_sel & 0x1) | ((txsize << 1) & 0x1e) | ((core_dependent << 7) & 0x80) | ((cdiv << 8) & 0xffffff00)
+
+
+def set_wfg_drive_uart_top_0_cfg(sw, core_sel=0, txsize=0, core_dependent=0, cdiv=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_CFG_ADDR, encode_wfg_drive_uart_top_0_cfg(core_sel, txsize, core_dependent, cdiv))
+
+
+def decode_wfg_drive_uart_top_0_cfg(word):
+    return {"CORE_SEL": word & 0x1, "TXSIZE": (word & 0x1e) >> 1, "CORE_DEPENDENT": (word & 0x80) >> 7, "CDIV": (word & 0xffffff00) >> 8}
+
+
+def get_wfg_drive_uart_top_0_cfg(sw):
+    return decode_wfg_drive_uart_top_0_cfg(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_CFG_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_CFG2_ADDR = 0x86008
+
+
+def encode_wfg_drive_uart_top_0_cfg2(parity_sel=0, stop_sel=0, tx_delay=0, shift_dir=0):
+    return (parity_sel & 0x3) | ((stop_sel << 2) & 0xc) | ((tx_delay << 4) & 0xffff0) | ((shift_dir << 20) & 0x100000)
+
+
+def set_wfg_drive_uart_top_0_cfg2(sw, parity_sel=0, stop_sel=0, tx_delay=0, shift_dir=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_CFG2_ADDR, encode_wfg_drive_uart_top_0_cfg2(parity_sel, stop_sel, tx_delay, shift_dir))
+
+
+def decode_wfg_drive_uart_top_0_cfg2(word):
+    return {"PARITY_SEL": word & 0x3, "STOP_SEL": (word & 0xc) >> 2, "TX_DELAY": (word & 0xffff0) >> 4, "SHIFT_DIR": (word & 0x100000) >> 20}
+
+
+def get_wfg_drive_uart_top_0_cfg2(sw):
+    return decode_wfg_drive_uart_top_0_cfg2(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_CFG2_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_RX_CFG_ADDR = 0x8600c
+
+
+def encode_wfg_drive_uart_top_0_rx_cfg(timeout=0):
+    return (timeout & 0x3ff)
+
+
+def set_wfg_drive_uart_top_0_rx_cfg(sw, timeout=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_RX_CFG_ADDR, encode_wfg_drive_uart_top_0_rx_cfg(timeout))
+
+
+def decode_wfg_drive_uart_top_0_rx_cfg(word):
+    return {"TIMEOUT": word & 0x3ff}
+
+
+def get_wfg_drive_uart_top_0_rx_cfg(sw):
+    return decode_wfg_drive_uart_top_0_rx_cfg(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_RX_CFG_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_ISR_ADDR = 0x860a0
+
+
+def encode_wfg_drive_uart_top_0_isr(timeout_reached=0, frame_error=0):
+    return (timeout_reached & 0x1) | ((frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_uart_top_0_isr(sw, timeout_reached=0, frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_ISR_ADDR, encode_wfg_drive_uart_top_0_isr(timeout_reached, frame_error))
+
+
+def decode_wfg_drive_uart_top_0_isr(word):
+    return {"TIMEOUT_REACHED": word & 0x1, "FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_uart_top_0_isr(sw):
+    return decode_wfg_drive_uart_top_0_isr(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_ISR_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_IER_ADDR = 0x860a4
+
+
+def encode_wfg_drive_uart_top_0_ier(timeout_reached=0, frame_error=0):
+    return (timeout_reached & 0x1) | ((frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_uart_top_0_ier(sw, timeout_reached=0, frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_IER_ADDR, encode_wfg_drive_uart_top_0_ier(timeout_reached, frame_error))
+
+
+def decode_wfg_drive_uart_top_0_ier(word):
+    return {"TIMEOUT_REACHED": word & 0x1, "FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_uart_top_0_ier(sw):
+    return decode_wfg_drive_uart_top_0_ier(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_IER_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_ICR_ADDR = 0x860a8
+
+
+def encode_wfg_drive_uart_top_0_icr(timeout_reached=0, frame_error=0):
+    return (timeout_reached & 0x1) | ((frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_uart_top_0_icr(sw, timeout_reached=0, frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_ICR_ADDR, encode_wfg_drive_uart_top_0_icr(timeout_reached, frame_error))
+
+
+def decode_wfg_drive_uart_top_0_icr(word):
+    return {"TIMEOUT_REACHED": word & 0x1, "FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_uart_top_0_icr(sw):
+    return decode_wfg_drive_uart_top_0_icr(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_ICR_ADDR))
+
+
+WFG_DRIVE_UART_TOP_0_MODULE_INFO_ADDR = 0x860fc
+
+
+def encode_wfg_drive_uart_top_0_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_drive_uart_top_0_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_0_MODULE_INFO_ADDR, encode_wfg_drive_uart_top_0_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_drive_uart_top_0_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_drive_uart_top_0_module_info(sw):
+    return decode_wfg_drive_uart_top_0_module_info(sw.readFPGARegister(WFG_DRIVE_UART_TOP_0_MODULE_INFO_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_CTRL_ADDR = 0x86100
+
+
+def encode_wfg_drive_uart_top_1_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_drive_uart_top_1_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_CTRL_ADDR, encode_wfg_drive_uart_top_1_ctrl(en))
+
+
+def decode_wfg_drive_uart_top_1_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_drive_uart_top_1_ctrl(sw):
+    return decode_wfg_drive_uart_top_1_ctrl(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_CTRL_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_CFG_ADDR = 0x86104
+
+
+def encode_wfg_drive_uart_top_1_cfg(core_sel=0, txsize=0, core_dependent=0, cdiv=0):
+    return (core_sel & 0x1) | ((txsize << 1) & 0x1e) | ((core_dependent << 7) & 0x80) | ((cdiv << 8) & 0xffffff00)
+
+
+def set_wfg_drive_uart_top_1_cfg(sw, core_sel=0, txsize=0, core_dependent=0, cdiv=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_CFG_ADDR, encode_wfg_drive_uart_top_1_cfg(core_sel, txsize, core_dependent, cdiv))
+
+
+def decode_wfg_drive_uart_top_1_cfg(word):
+    return {"CORE_SEL": word & 0x1, "TXSIZE": (word & 0x1e) >> 1, "CORE_DEPENDENT": (word & 0x80) >> 7, "CDIV": (word & 0xffffff00) >> 8}
+
+
+def get_wfg_drive_uart_top_1_cfg(sw):
+    return decode_wfg_drive_uart_top_1_cfg(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_CFG_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_CFG2_ADDR = 0x86108
+
+
+def encode_wfg_drive_uart_top_1_cfg2(parity_sel=0, stop_sel=0, tx_delay=0, shift_dir=0):
+    return (parity_sel & 0x3) | ((stop_sel << 2) & 0xc) | ((tx_delay << 4) & 0xffff0) | ((shift_dir << 20) & 0x100000)
+
+
+def set_wfg_drive_uart_top_1_cfg2(sw, parity_sel=0, stop_sel=0, tx_delay=0, shift_dir=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_CFG2_ADDR, encode_wfg_drive_uart_top_1_cfg2(parity_sel, stop_sel, tx_delay, shift_dir))
+
+
+def decode_wfg_drive_uart_top_1_cfg2(word):
+    return {"PARITY_SEL": word & 0x3, "STOP_SEL": (word & 0xc) >> 2, "TX_DELAY": (word & 0xffff0) >> 4, "SHIFT_DIR": (word & 0x100000) >> 20}
+
+
+def get_wfg_drive_uart_top_1_cfg2(sw):
+    return decode_wfg_drive_uart_top_1_cfg2(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_CFG2_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_RX_CFG_ADDR = 0x8610c
+
+
+def encode_wfg_drive_uart_top_1_rx_cfg(timeout=0):
+    return (timeout & 0x3ff)
+
+
+def set_wfg_drive_uart_top_1_rx_cfg(sw, timeout=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_RX_CFG_ADDR, encode_wfg_drive_uart_top_1_rx_cfg(timeout))
+
+
+def decode_wfg_drive_uart_top_1_rx_cfg(word):
+    return {"TIMEOUT": word & 0x3ff}
+
+
+def get_wfg_drive_uart_top_1_rx_cfg(sw):
+    return decode_wfg_drive_uart_top_1_rx_cfg(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_RX_CFG_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_ISR_ADDR = 0x861a0
+
+
+def encode_wfg_drive_uart_top_1_isr(timeout_reached=0, frame_error=0):
+    return (timeout_reached & 0x1) | ((frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_uart_top_1_isr(sw, timeout_reached=0, frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_ISR_ADDR, encode_wfg_drive_uart_top_1_isr(timeout_reached, frame_error))
+
+
+def decode_wfg_drive_uart_top_1_isr(word):
+    return {"TIMEOUT_REACHED": word & 0x1, "FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_uart_top_1_isr(sw):
+    return decode_wfg_drive_uart_top_1_isr(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_ISR_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_IER_ADDR = 0x861a4
+
+
+def encode_wfg_drive_uart_top_1_ier(timeout_reached=0, frame_error=0):
+    return (timeout_reached & 0x1) | ((frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_uart_top_1_ier(sw, timeout_reached=0, frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_IER_ADDR, encode_wfg_drive_uart_top_1_ier(timeout_reached, frame_error))
+
+
+def decode_wfg_drive_uart_top_1_ier(word):
+    return {"TIMEOUT_REACHED": word & 0x1, "FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_uart_top_1_ier(sw):
+    return decode_wfg_drive_uart_top_1_ier(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_IER_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_ICR_ADDR = 0x861a8
+
+
+def encode_wfg_drive_uart_top_1_icr(timeout_reached=0, frame_error=0):
+    return (timeout_reached & 0x1) | ((frame_error << 1) & 0x2)
+
+
+def set_wfg_drive_uart_top_1_icr(sw, timeout_reached=0, frame_error=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_ICR_ADDR, encode_wfg_drive_uart_top_1_icr(timeout_reached, frame_error))
+
+
+def decode_wfg_drive_uart_top_1_icr(word):
+    return {"TIMEOUT_REACHED": word & 0x1, "FRAME_ERROR": (word & 0x2) >> 1}
+
+
+def get_wfg_drive_uart_top_1_icr(sw):
+    return decode_wfg_drive_uart_top_1_icr(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_ICR_ADDR))
+
+
+WFG_DRIVE_UART_TOP_1_MODULE_INFO_ADDR = 0x861fc
+
+
+def encode_wfg_drive_uart_top_1_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_drive_uart_top_1_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_DRIVE_UART_TOP_1_MODULE_INFO_ADDR, encode_wfg_drive_uart_top_1_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_drive_uart_top_1_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_drive_uart_top_1_module_info(sw):
+    return decode_wfg_drive_uart_top_1_module_info(sw.readFPGARegister(WFG_DRIVE_UART_TOP_1_MODULE_INFO_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_CTRL_ADDR = 0xa0000
+
+
+def encode_wfg_record_mem_top_0_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_record_mem_top_0_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_CTRL_ADDR, encode_wfg_record_mem_top_0_ctrl(en))
+
+
+def decode_wfg_record_mem_top_0_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_record_mem_top_0_ctrl(sw):
+    return decode_wfg_record_mem_top_0_ctrl(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_CTRL_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_CFG_ADDR = 0xa0004
+
+
+def encode_wfg_record_mem_top_0_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_record_mem_top_0_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_CFG_ADDR, encode_wfg_record_mem_top_0_cfg(cnt))
+
+
+def decode_wfg_record_mem_top_0_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_record_mem_top_0_cfg(sw):
+    return decode_wfg_record_mem_top_0_cfg(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_CFG_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_START_ADDR = 0xa0008
+
+
+def encode_wfg_record_mem_top_0_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_0_start(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_START_ADDR, encode_wfg_record_mem_top_0_start(val))
+
+
+def decode_wfg_record_mem_top_0_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_0_start(sw):
+    return decode_wfg_record_mem_top_0_start(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_START_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_STOP_ADDR = 0xa000c
+
+
+def encode_wfg_record_mem_top_0_stop(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_0_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_STOP_ADDR, encode_wfg_record_mem_top_0_stop(val))
+
+
+def decode_wfg_record_mem_top_0_stop(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_0_stop(sw):
+    return decode_wfg_record_mem_top_0_stop(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_STOP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_STEP_ADDR = 0xa0010
+
+
+def encode_wfg_record_mem_top_0_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_0_step(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_STEP_ADDR, encode_wfg_record_mem_top_0_step(val))
+
+
+def decode_wfg_record_mem_top_0_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_0_step(sw):
+    return decode_wfg_record_mem_top_0_step(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_STEP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_ADDR_ADDR = 0xa0014
+
+
+def encode_wfg_record_mem_top_0_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_0_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_ADDR_ADDR, encode_wfg_record_mem_top_0_addr(val))
+
+
+def decode_wfg_record_mem_top_0_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_0_addr(sw):
+    return decode_wfg_record_mem_top_0_addr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_ADDR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_ISR_ADDR = 0xa00a0
+
+
+def encode_wfg_record_mem_top_0_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_0_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_ISR_ADDR, encode_wfg_record_mem_top_0_isr(done, end))
+
+
+def decode_wfg_record_mem_top_0_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_0_isr(sw):
+    return decode_wfg_record_mem_top_0_isr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_ISR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_IER_ADDR = 0xa00a4
+
+
+def encode_wfg_record_mem_top_0_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_0_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_IER_ADDR, encode_wfg_record_mem_top_0_ier(done, end))
+
+
+def decode_wfg_record_mem_top_0_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_0_ier(sw):
+    return decode_wfg_record_mem_top_0_ier(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_IER_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_ICR_ADDR = 0xa00a8
+
+
+def encode_wfg_record_mem_top_0_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_0_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_ICR_ADDR, encode_wfg_record_mem_top_0_icr(done, end))
+
+
+def decode_wfg_record_mem_top_0_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_0_icr(sw):
+    return decode_wfg_record_mem_top_0_icr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_ICR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_0_MODULE_INFO_ADDR = 0xa00fc
+
+
+def encode_wfg_record_mem_top_0_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_record_mem_top_0_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_0_MODULE_INFO_ADDR, encode_wfg_record_mem_top_0_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_record_mem_top_0_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_record_mem_top_0_module_info(sw):
+    return decode_wfg_record_mem_top_0_module_info(sw.readFPGARegister(WFG_RECORD_MEM_TOP_0_MODULE_INFO_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_CTRL_ADDR = 0xa0100
+
+
+def encode_wfg_record_mem_top_1_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_record_mem_top_1_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_CTRL_ADDR, encode_wfg_record_mem_top_1_ctrl(en))
+
+
+def decode_wfg_record_mem_top_1_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_record_mem_top_1_ctrl(sw):
+    return decode_wfg_record_mem_top_1_ctrl(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_CTRL_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_CFG_ADDR = 0xa0104
+
+
+def encode_wfg_record_mem_top_1_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_record_mem_top_1_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_CFG_ADDR, encode_wfg_record_mem_top_1_cfg(cnt))
+
+
+def decode_wfg_record_mem_top_1_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_record_mem_top_1_cfg(sw):
+    return decode_wfg_record_mem_top_1_cfg(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_CFG_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_START_ADDR = 0xa0108
+
+
+def encode_wfg_record_mem_top_1_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_1_start(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_START_ADDR, encode_wfg_record_mem_top_1_start(val))
+
+
+def decode_wfg_record_mem_top_1_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_1_start(sw):
+    return decode_wfg_record_mem_top_1_start(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_START_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_STOP_ADDR = 0xa010c
+
+
+def encode_wfg_record_mem_top_1_stop(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_1_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_STOP_ADDR, encode_wfg_record_mem_top_1_stop(val))
+
+
+def decode_wfg_record_mem_top_1_stop(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_1_stop(sw):
+    return decode_wfg_record_mem_top_1_stop(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_STOP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_STEP_ADDR = 0xa0110
+
+
+def encode_wfg_record_mem_top_1_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_1_step(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_STEP_ADDR, encode_wfg_record_mem_top_1_step(val))
+
+
+def decode_wfg_record_mem_top_1_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_1_step(sw):
+    return decode_wfg_record_mem_top_1_step(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_STEP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_ADDR_ADDR = 0xa0114
+
+
+def encode_wfg_record_mem_top_1_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_1_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_ADDR_ADDR, encode_wfg_record_mem_top_1_addr(val))
+
+
+def decode_wfg_record_mem_top_1_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_1_addr(sw):
+    return decode_wfg_record_mem_top_1_addr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_ADDR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_ISR_ADDR = 0xa01a0
+
+
+def encode_wfg_record_mem_top_1_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_1_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_ISR_ADDR, encode_wfg_record_mem_top_1_isr(done, end))
+
+
+def decode_wfg_record_mem_top_1_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_1_isr(sw):
+    return decode_wfg_record_mem_top_1_isr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_ISR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_IER_ADDR = 0xa01a4
+
+
+def encode_wfg_record_mem_top_1_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_1_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_IER_ADDR, encode_wfg_record_mem_top_1_ier(done, end))
+
+
+def decode_wfg_record_mem_top_1_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_1_ier(sw):
+    return decode_wfg_record_mem_top_1_ier(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_IER_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_ICR_ADDR = 0xa01a8
+
+
+def encode_wfg_record_mem_top_1_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_1_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_ICR_ADDR, encode_wfg_record_mem_top_1_icr(done, end))
+
+
+def decode_wfg_record_mem_top_1_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_1_icr(sw):
+    return decode_wfg_record_mem_top_1_icr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_ICR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_1_MODULE_INFO_ADDR = 0xa01fc
+
+
+def encode_wfg_record_mem_top_1_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_record_mem_top_1_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_1_MODULE_INFO_ADDR, encode_wfg_record_mem_top_1_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_record_mem_top_1_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_record_mem_top_1_module_info(sw):
+    return decode_wfg_record_mem_top_1_module_info(sw.readFPGARegister(WFG_RECORD_MEM_TOP_1_MODULE_INFO_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_CTRL_ADDR = 0xa0200
+
+
+def encode_wfg_record_mem_top_2_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_record_mem_top_2_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_CTRL_ADDR, encode_wfg_record_mem_top_2_ctrl(en))
+
+
+def decode_wfg_record_mem_top_2_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_record_mem_top_2_ctrl(sw):
+    return decode_wfg_record_mem_top_2_ctrl(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_CTRL_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_CFG_ADDR = 0xa0204
+
+
+def encode_wfg_record_mem_top_2_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_record_mem_top_2_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_CFG_ADDR, encode_wfg_record_mem_top_2_cfg(cnt))
+
+
+def decode_wfg_record_mem_top_2_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_record_mem_top_2_cfg(sw):
+    return decode_wfg_record_mem_top_2_cfg(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_CFG_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_START_ADDR = 0xa0208
+
+
+def encode_wfg_record_mem_top_2_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_2_start(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_START_ADDR, encode_wfg_record_mem_top_2_start(val))
+
+
+def decode_wfg_record_mem_top_2_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_2_start(sw):
+    return decode_wfg_record_mem_top_2_start(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_START_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_STOP_ADDR = 0xa020c
+
+
+def encode_wfg_record_mem_top_2_stop(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_2_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_STOP_ADDR, encode_wfg_record_mem_top_2_stop(val))
+
+
+def decode_wfg_record_mem_top_2_stop(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_2_stop(sw):
+    return decode_wfg_record_mem_top_2_stop(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_STOP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_STEP_ADDR = 0xa0210
+
+
+def encode_wfg_record_mem_top_2_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_2_step(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_STEP_ADDR, encode_wfg_record_mem_top_2_step(val))
+
+
+def decode_wfg_record_mem_top_2_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_2_step(sw):
+    return decode_wfg_record_mem_top_2_step(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_STEP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_ADDR_ADDR = 0xa0214
+
+
+def encode_wfg_record_mem_top_2_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_2_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_ADDR_ADDR, encode_wfg_record_mem_top_2_addr(val))
+
+
+def decode_wfg_record_mem_top_2_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_2_addr(sw):
+    return decode_wfg_record_mem_top_2_addr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_ADDR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_ISR_ADDR = 0xa02a0
+
+
+def encode_wfg_record_mem_top_2_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_2_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_ISR_ADDR, encode_wfg_record_mem_top_2_isr(done, end))
+
+
+def decode_wfg_record_mem_top_2_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_2_isr(sw):
+    return decode_wfg_record_mem_top_2_isr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_ISR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_IER_ADDR = 0xa02a4
+
+
+def encode_wfg_record_mem_top_2_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_2_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_IER_ADDR, encode_wfg_record_mem_top_2_ier(done, end))
+
+
+def decode_wfg_record_mem_top_2_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_2_ier(sw):
+    return decode_wfg_record_mem_top_2_ier(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_IER_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_ICR_ADDR = 0xa02a8
+
+
+def encode_wfg_record_mem_top_2_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_2_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_ICR_ADDR, encode_wfg_record_mem_top_2_icr(done, end))
+
+
+def decode_wfg_record_mem_top_2_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_2_icr(sw):
+    return decode_wfg_record_mem_top_2_icr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_ICR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_2_MODULE_INFO_ADDR = 0xa02fc
+
+
+def encode_wfg_record_mem_top_2_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_record_mem_top_2_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_2_MODULE_INFO_ADDR, encode_wfg_record_mem_top_2_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_record_mem_top_2_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_record_mem_top_2_module_info(sw):
+    return decode_wfg_record_mem_top_2_module_info(sw.readFPGARegister(WFG_RECORD_MEM_TOP_2_MODULE_INFO_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_CTRL_ADDR = 0xa0300
+
+
+def encode_wfg_record_mem_top_3_ctrl(en=0):
+    return (en & 0x1)
+
+
+def set_wfg_record_mem_top_3_ctrl(sw, en=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_CTRL_ADDR, encode_wfg_record_mem_top_3_ctrl(en))
+
+
+def decode_wfg_record_mem_top_3_ctrl(word):
+    return {"EN": word & 0x1}
+
+
+def get_wfg_record_mem_top_3_ctrl(sw):
+    return decode_wfg_record_mem_top_3_ctrl(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_CTRL_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_CFG_ADDR = 0xa0304
+
+
+def encode_wfg_record_mem_top_3_cfg(cnt=0):
+    return (cnt & 0xff)
+
+
+def set_wfg_record_mem_top_3_cfg(sw, cnt=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_CFG_ADDR, encode_wfg_record_mem_top_3_cfg(cnt))
+
+
+def decode_wfg_record_mem_top_3_cfg(word):
+    return {"CNT": word & 0xff}
+
+
+def get_wfg_record_mem_top_3_cfg(sw):
+    return decode_wfg_record_mem_top_3_cfg(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_CFG_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_START_ADDR = 0xa0308
+
+
+def encode_wfg_record_mem_top_3_start(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_3_start(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_START_ADDR, encode_wfg_record_mem_top_3_start(val))
+
+
+def decode_wfg_record_mem_top_3_start(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_3_start(sw):
+    return decode_wfg_record_mem_top_3_start(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_START_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_STOP_ADDR = 0xa030c
+
+
+def encode_wfg_record_mem_top_3_stop(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_3_stop(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_STOP_ADDR, encode_wfg_record_mem_top_3_stop(val))
+
+
+def decode_wfg_record_mem_top_3_stop(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_3_stop(sw):
+    return decode_wfg_record_mem_top_3_stop(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_STOP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_STEP_ADDR = 0xa0310
+
+
+def encode_wfg_record_mem_top_3_step(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_3_step(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_STEP_ADDR, encode_wfg_record_mem_top_3_step(val))
+
+
+def decode_wfg_record_mem_top_3_step(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_3_step(sw):
+    return decode_wfg_record_mem_top_3_step(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_STEP_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_ADDR_ADDR = 0xa0314
+
+
+def encode_wfg_record_mem_top_3_addr(val=0):
+    return (val & 0x1fff)
+
+
+def set_wfg_record_mem_top_3_addr(sw, val=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_ADDR_ADDR, encode_wfg_record_mem_top_3_addr(val))
+
+
+def decode_wfg_record_mem_top_3_addr(word):
+    return {"VAL": word & 0x1fff}
+
+
+def get_wfg_record_mem_top_3_addr(sw):
+    return decode_wfg_record_mem_top_3_addr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_ADDR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_ISR_ADDR = 0xa03a0
+
+
+def encode_wfg_record_mem_top_3_isr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_3_isr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_ISR_ADDR, encode_wfg_record_mem_top_3_isr(done, end))
+
+
+def decode_wfg_record_mem_top_3_isr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_3_isr(sw):
+    return decode_wfg_record_mem_top_3_isr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_ISR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_IER_ADDR = 0xa03a4
+
+
+def encode_wfg_record_mem_top_3_ier(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_3_ier(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_IER_ADDR, encode_wfg_record_mem_top_3_ier(done, end))
+
+
+def decode_wfg_record_mem_top_3_ier(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_3_ier(sw):
+    return decode_wfg_record_mem_top_3_ier(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_IER_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_ICR_ADDR = 0xa03a8
+
+
+def encode_wfg_record_mem_top_3_icr(done=0, end=0):
+    return (done & 0x1) | ((end << 1) & 0x2)
+
+
+def set_wfg_record_mem_top_3_icr(sw, done=0, end=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_ICR_ADDR, encode_wfg_record_mem_top_3_icr(done, end))
+
+
+def decode_wfg_record_mem_top_3_icr(word):
+    return {"DONE": word & 0x1, "END": (word & 0x2) >> 1}
+
+
+def get_wfg_record_mem_top_3_icr(sw):
+    return decode_wfg_record_mem_top_3_icr(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_ICR_ADDR))
+
+
+WFG_RECORD_MEM_TOP_3_MODULE_INFO_ADDR = 0xa03fc
+
+
+def encode_wfg_record_mem_top_3_module_info(patch=0, minor=0, major=0, type=0, block=0):
+    return (patch & 0xff) | ((minor << 8) & 0xff00) | ((major << 16) & 0xff0000) | ((type << 27) & 0x8000000) | ((block << 28) & 0xf0000000)
+
+
+def set_wfg_record_mem_top_3_module_info(sw, patch=0, minor=0, major=0, type=0, block=0):
+    sw.writeFPGARegister(WFG_RECORD_MEM_TOP_3_MODULE_INFO_ADDR, encode_wfg_record_mem_top_3_module_info(patch, minor, major, type, block))
+
+
+def decode_wfg_record_mem_top_3_module_info(word):
+    return {"PATCH": word & 0xff, "MINOR": (word & 0xff00) >> 8, "MAJOR": (word & 0xff0000) >> 16, "TYPE": (word & 0x8000000) >> 27, "BLOCK": (word & 0xf0000000) >> 28}
+
+
+def get_wfg_record_mem_top_3_module_info(sw):
+    return decode_wfg_record_mem_top_3_module_info(sw.readFPGARegister(WFG_RECORD_MEM_TOP_3_MODULE_INFO_ADDR))
@@ -9,117 +9,135 @@ Copyright © 2024 semify GmbH. All rights reserved.
 import sys
 import os
 import logging
-import time
+import logging.handlers
+import queue
 import threading
 import numpy as np
 
 from datetime import datetime
 from SmartWaveAPI import SmartWave
-from fpga_reg import FPGA_Reg
+from fpga_reg import FPGA_Reg, write_burst
+from fpga_regs_gen import (
+    WFG_DRIVE_I2CT_TOP_0_CFG_ADDR, encode_wfg_drive_i2ct_top_0_cfg,
+    WFG_DRIVE_I2CT_TOP_0_CTRL_ADDR, encode_wfg_drive_i2ct_top_0_ctrl,
+    WFG_DRIVE_I2CT_TOP_0_REGADDR_ADDR, encode_wfg_drive_i2ct_top_0_regaddr,
+    WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR, encode_wfg_drive_i2ct_top_0_regwdata,
+    WFG_PIN_MUX_TOP_INPUT_SEL_0_ADDR, encode_wfg_pin_mux_top_input_sel_0,
+    WFG_PIN_MUX_TOP_OUTPUT_SEL_0_ADDR, encode_wfg_pin_mux_top_output_sel_0,
+    WFG_PIN_MUX_TOP_PULLUP_SEL_0_ADDR, encode_wfg_pin_mux_top_pullup_sel_0
+)
 
+logger = logging.getLogger(__name__)
 
-def i2ct_conf(sw):
+# (block, register, field) keys of the FPGA_Reg.flat table used for the readbacks
+I2CT_CTRL_EN = ("wfg_drive_i2ct_top_0", "CTRL", "EN")
+I2CT_CFG_DEVID = ("wfg_drive_i2ct_top_0", "CFG", "DEVID")
+
+
+def _i2ct_conf_writes():
     """
-        This function configures the I2C target for the MCP9808 sensor emulation
+        Build the (addr, value) register writes that configure the I2C target for the MCP9808 emulation
     """
     i2ct_addr = 0x18  # I2C address of the MCP9808 Temperature Sensor
     i2ct_devid_addr = 0x07  # Unique device ID register address
     i2ct_devid_val = 0x0037  # Arbitrary device ID, set to 55
 
-    # Define the registers of the I2C target modules
-    i2ct_env = FPGA_Reg.registers["wfg_drive_i2ct_top_0"]
-    i2ct_en = i2ct_env["CTRL"]["addr"]
-    i2ct_dev_addr = i2ct_env["CFG"]["addr"]
-    i2ct_reg_addr = i2ct_env["REGADDR"]["addr"]
-    i2ct_regwdata_addr = i2ct_env["REGWDATA"]["addr"]
-
-    # Setup I2C address within the I2C target
-    set_addr = 0
-    set_addr |= i2ct_addr << i2ct_env["CFG"]["DEVID"]["LSB"]
-    set_addr |= 0b01 << i2ct_env["CFG"]["DATASIZE"]["LSB"]
-    sw.writeFPGARegister(i2ct_dev_addr, set_addr)
-    read_data = sw.readFPGARegister(i2ct_dev_addr)
-    read_data = read_data >> i2ct_env["CFG"]["DEVID"]["LSB"]
-    logging.info(f"[I2C_T ADDR] - Data read back: {read_data:#0x} from {i2ct_dev_addr:#0x}")
-
-    # Setup DeviceID within the I2C target
-    set_id = 0
-    set_id |= i2ct_devid_addr << i2ct_env["REGADDR"]["ADDR"]["LSB"]
-    sw.writeFPGARegister(i2ct_reg_addr, set_id)
-
-    # Setup DeviceID register within the I2C target
-    set_id = 0
-    set_id |= i2ct_devid_val << i2ct_env["REGWDATA"]["DATA"]["LSB"]
-    sw.writeFPGARegister(i2ct_regwdata_addr, set_id)
-    read_data = sw.readFPGARegister(i2ct_regwdata_addr)
-    logging.info(f"[DEV ID WRITE_REG] - Data read back: {read_data:#0x} from address: {i2ct_regwdata_addr:#0x}")
-
-    set_en = 0
-    set_en |= 1 << i2ct_env["CTRL"]["EN"]["LSB"]
-    sw.writeFPGARegister(i2ct_en, set_en)
-    read_data = sw.readFPGARegister(i2ct_en)
-    read_data = read_data >> i2ct_env["CTRL"]["EN"]["LSB"]
-    logging.info(f"[I2C_T EN] - Data read back: {read_data:#0x} from register: {i2ct_en:#0x}")
+    return (
+        # Setup I2C address within the I2C target
+        (WFG_DRIVE_I2CT_TOP_0_CFG_ADDR, encode_wfg_drive_i2ct_top_0_cfg(devid=i2ct_addr, datasize=0b01)),
+        # Setup DeviceID within the I2C target
+        (WFG_DRIVE_I2CT_TOP_0_REGADDR_ADDR, encode_wfg_drive_i2ct_top_0_regaddr(addr=i2ct_devid_addr)),
+        # Setup DeviceID register within the I2C target
+        (WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR, encode_wfg_drive_i2ct_top_0_regwdata(data=i2ct_devid_val)),
+        # Enable the I2C target
+        (WFG_DRIVE_I2CT_TOP_0_CTRL_ADDR, encode_wfg_drive_i2ct_top_0_ctrl(en=1)),
+    )
 
 
-def i2ct_amb_temp(sw, ta_data):
+def _pin_mux_writes():
+    """
+        Build the (addr, value) register writes that rout the I2C target's SCL and SDA lines onto Pin A1
+        and Pin A2 of SmartWave
+    """
+    i2ct_scl_i = 3  # I2C target SCL input
+    i2ct_sda_i = 2  # I2C target SDA input
+    i2ct_scl_o = 6  # I2C target SCL output
+    i2ct_sda_o = 5  # I2C target SDA output
+
+    return (
+        # I2CT_SCL and I2CT_SDA input enable, SCL on pin A1 and SDA on pin A2
+        (WFG_PIN_MUX_TOP_INPUT_SEL_0_ADDR, encode_wfg_pin_mux_top_input_sel_0(pin_0=i2ct_scl_i, pin_1=i2ct_sda_i)),
+        # I2CT_SCL and I2CT_SDA output enable, SCL on pin A1 and SDA on pin A2
+        (WFG_PIN_MUX_TOP_OUTPUT_SEL_0_ADDR, encode_wfg_pin_mux_top_output_sel_0(pin_0=i2ct_scl_o, pin_1=i2ct_sda_o)),
+        # I2CT_SCL and I2CT_SDA pulled-up enable
+        (WFG_PIN_MUX_TOP_PULLUP_SEL_0_ADDR, encode_wfg_pin_mux_top_pullup_sel_0(pin_0=1, pin_1=1)),
+    )
+
+
+# The configuration only depends on constants, so the register writes are assembled once at import
+_I2CT_CONF_WRITES = _i2ct_conf_writes()
+_PINMUX_WRITES = _pin_mux_writes()
+# Selects the ambient temperature register (0x05) of the I2C target
+_TA_REGADDR_WRITE = (WFG_DRIVE_I2CT_TOP_0_REGADDR_ADDR, encode_wfg_drive_i2ct_top_0_regaddr(addr=0x05))
+
+
+def i2ct_conf(sw):
     """
         This function configures the I2C target for the MCP9808 sensor emulation
     """
-    i2ct_ta_reg = 0x05      # Ambient temperature register address
+    write_burst(sw, _I2CT_CONF_WRITES)
+    i2ct_amb_temp.last_ta = None  # A (re)configured target no longer holds a known temperature
 
-    # Define the registers of the I2C target modules
-    i2ct_env = FPGA_Reg.registers["wfg_drive_i2ct_top_0"]
-    i2ct_reg_addr = i2ct_env["REGADDR"]["addr"]
-    i2ct_regwdata_addr = i2ct_env["REGWDATA"]["addr"]
+    # The readbacks only verify the writes for the debug log, each is a full USB round-trip. They are
+    # skipped unless DEBUG logging is enabled and removed entirely under python -O.
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        devid = FPGA_Reg.flat[I2CT_CFG_DEVID]
+        read_data = sw.readFPGARegister(devid.addr)
+        read_data = read_data >> devid.shift
+        logger.debug("[I2C_T ADDR] - Data read back: %#x from %#x", read_data, devid.addr)
 
-    # Setup the ambient temperature  register of the I2C target
-    set_amb = 0
-    set_amb |= i2ct_ta_reg << i2ct_env["REGADDR"]["ADDR"]["LSB"]
-    sw.writeFPGARegister(i2ct_reg_addr, set_amb)
+        read_data = sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR)
+        logger.debug("[DEV ID WRITE_REG] - Data read back: %#x from address: %#x",
+                     read_data, WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR)
 
-    # Setup the ambient register write data of the I2C target
-    set_amb = 0
-    set_amb |= ta_data << i2ct_env["REGWDATA"]["DATA"]["LSB"]
-    sw.writeFPGARegister(i2ct_regwdata_addr, set_amb)
-    read_data = sw.readFPGARegister(i2ct_regwdata_addr)
-    logging.info(f"[T_AMB WRITE_REG] - Data read back: {read_data:#0x} // {int(read_data)} "
-                 f"from address: {i2ct_regwdata_addr:#0x}")
+        en = FPGA_Reg.flat[I2CT_CTRL_EN]
+        read_data = sw.readFPGARegister(en.addr)
+        read_data = read_data >> en.shift
+        logger.debug("[I2C_T EN] - Data read back: %#x from register: %#x", read_data, en.addr)
 
 
-def pin_mux_conf(sw):
+def i2ct_amb_temp(sw, ta_data):
     """
-        This function routs out the I2C target's SCL and SDA lines onto Pin A1 and Pin A2 of SmartWave
+        This function configures the I2C target for the MCP9808 sensor emulation. Returns False if
+        ta_data is already the ambient temperature and nothing was written.
     """
-    # Configure the desired pins by writing to the FPGA's register
-    i2ct_scl_i = 3  # I2C target SCL input
-    i2ct_sda_i = 2  # I2C target SDA input
-    i2ct_scl_o = 6  # I2C target SCL output
-    i2ct_sda_o = 5  # I2C target SDA output
+    # Re-entering the same temperature needs no bus traffic
+    if ta_data == i2ct_amb_temp.last_ta:
+        return False
 
-    # Set I2C target environment for pin muxing
-    localenv = FPGA_Reg.registers["wfg_pin_mux_top"]
+    # Select the ambient temperature register of the I2C target and write its data
+    write_burst(sw, (
+        _TA_REGADDR_WRITE,
+        (WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR, encode_wfg_drive_i2ct_top_0_regwdata(data=ta_data))
+    ))
 
-    # I2CT_SCL and I2CT_SDA input enable
-    addr = localenv["INPUT_SEL_0"]["addr"]
-    pingroup = 0
-    pingroup |= i2ct_scl_i << localenv["INPUT_SEL_0"]["0"]["LSB"]  # SCL on pin A1
-    pingroup |= i2ct_sda_i << localenv["INPUT_SEL_0"]["1"]["LSB"]  # SDA on pin A2
-    sw.writeFPGARegister(addr, pingroup)
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        read_data = sw.readFPGARegister(WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR)
+        logger.debug("[T_AMB WRITE_REG] - Data read back: %#x // %d from address: %#x",
+                     read_data, read_data, WFG_DRIVE_I2CT_TOP_0_REGWDATA_ADDR)
 
-    # I2CT_SCL and I2CT_SDA output enable
-    addr = localenv["OUTPUT_SEL_0"]["addr"]
-    pingroup = 0
-    pingroup |= i2ct_scl_o << localenv["OUTPUT_SEL_0"]["0"]["LSB"]  # SCL on pin A1
-    pingroup |= i2ct_sda_o << localenv["OUTPUT_SEL_0"]["1"]["LSB"]  # SDA on pin A2
-    sw.writeFPGARegister(addr, pingroup)
+    i2ct_amb_temp.last_ta = ta_data
+    return True
 
-    # I2CT_SCL and I2CT_SDA pulled-up enable
-    addr = localenv["PULLUP_SEL_0"]["addr"]
-    pingroup = 0
-    pingroup |= 1 << localenv["PULLUP_SEL_0"]["0"]["LSB"]
-    pingroup |= 1 << localenv["PULLUP_SEL_0"]["1"]["LSB"]
-    sw.writeFPGARegister(addr, pingroup)
+
+i2ct_amb_temp.last_ta = None
+
+
+def pin_mux_conf(sw):
+    """
+        This function routs out the I2C target's SCL and SDA lines onto Pin A1 and Pin A2 of SmartWave
+    """
+    write_burst(sw, _PINMUX_WRITES)
 
 
 def temp_conv(ta_data: float) -> int:
@@ -151,6 +169,17 @@ def temp_conv(ta_data: float) -> int:
     return ta_bin
 
 
+def put_latest(ta_queue, value):
+    """
+        Put a value into a single-slot queue, replacing a value that has not been consumed yet
+    """
+    try:
+        ta_queue.get_nowait()
+    except queue.Empty:
+        pass
+    ta_queue.put_nowait(value)
+
+
 def main():
     """
         Main function for the sensor emulation
@@ -159,52 +188,69 @@ def main():
 
     # Create directory to save the log files
     directory = "./mcp9808_emulation.logs"
-    if not os.path.exists(directory):
-        os.mkdir(directory)
+    os.makedirs(directory, exist_ok=True)
 
     date_time = datetime.now().strftime("%Y.%m.%d_%H.%M.%S")
     file_name = f'Sensor_emulation_{date_time}.log'
     fq_fn = os.path.join(directory, file_name)
+    # The log file is written in batches of up to 128 records instead of once per record. Errors are
+    # written out immediately, logging.shutdown() at interpreter exit flushes the rest.
+    file_handler = logging.FileHandler(filename=fq_fn, encoding='utf-8', delay=True)
+    memory_handler = logging.handlers.MemoryHandler(capacity=128, flushLevel=logging.ERROR,
+                                                    target=file_handler)
     logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s',
                         datefmt="%Y-%m-%d %H:%M:%S",
-                        encoding='utf-8', level=logging.DEBUG,
+                        level=logging.INFO,
                         handlers=[
                             logging.StreamHandler(sys.stdout),
-                            logging.FileHandler(filename=fq_fn)
+                            memory_handler
                         ]
                         )
+    # The buffered records are formatted by the target, give it the format basicConfig applied
+    file_handler.setFormatter(memory_handler.formatter)
 
-    ta_data = 30
+    # Single-slot queue between the input thread and the FPGA writes. A new value replaces one that
+    # has not been written yet, so only the latest temperature is sent to SmartWave.
+    ta_queue = queue.Queue(maxsize=1)
 
-    def update_ta_data(sw):
+    def update_ta_data():
         """
             This function takes a new user input to update the ambient temperature value
         """
-        nonlocal ta_data
-        while True:
-            try:
-                new_value = input("Enter new ambient temperature: ")
-                if new_value.lower() == 'exit':
-                    print("Exiting input thread.")
-                    break
-                ta_data = temp_conv(float(new_value))
-                i2ct_amb_temp(sw, ta_data)
-                logging.info(f"Updated ambient temperature to: {ta_data}")
-            except ValueError:
-                print("Invalid input. Please enter an integer.")
+        try:
+            while True:
+                try:
+                    new_value = input("Enter new ambient temperature: ")
+                    if new_value.lower() == 'exit':
+                        print("Exiting input thread.")
+                        break
+                    put_latest(ta_queue, temp_conv(float(new_value)))
+                except ValueError:
+                    print("Invalid input. Please enter an integer.")
+        finally:
+            # Tell the main thread to stop, after it has written any pending value
+            ta_queue.put(None)
 
     # Setup connection to SmartWave
     with SmartWave().connect() as sw:
-        logging.info("Successfully connected to SmartWave")
-        logging.info("Configure the I2C target for the MCP9808 temperature sensor emulation")
+        logger.info("Successfully connected to SmartWave")
+        logger.info("Configure the I2C target for the MCP9808 temperature sensor emulation")
         i2ct_conf(sw)
-        logging.info("Rout out the I2C target SCL and SDA lines to the physical pins")
+        logger.info("Rout out the I2C target SCL and SDA lines to the physical pins")
         pin_mux_conf(sw)
-        input_thread = threading.Thread(target=update_ta_data(sw), daemon=True)
+        input_thread = threading.Thread(target=update_ta_data, daemon=True)
         input_thread.start()
 
-        while input_thread.is_alive():
-            time.sleep(1)
+        # Block until a new value or the stop signal arrives instead of waking up periodically
+        while True:
+            ta_data = ta_queue.get()
+            if ta_data is None:
+                break
+            if i2ct_amb_temp(sw, ta_data):
+                logger.info("Updated ambient temperature to: %d", ta_data)
+            else:
+                logger.debug("Ambient temperature unchanged: %d", ta_data)
+        input_thread.join()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Script Name: gen_regs.py
+Description: Generates fpga_regs_gen.py, a module with one address constant and encode/set/get functions
+             per FPGA register, so callers do not have to look up and combine bitfields at runtime.
+Usage: python tools/gen_regs.py [output file]
+"""
+
+import keyword
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from fpga_reg import REGISTERS, FieldSpec  # noqa: E402
+
+
+def arg_name(field):
+    """
+        Turn a field name into a function argument name
+    """
+    if field[0].isdigit():
+        # The numbered fields of the pin mux select registers are pin numbers
+        return f"pin_{field}"
+    name = field.lower()
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def gen_register(block, reg, entries):
+    """
+        Generate the address constant and the encode/set/get functions of one register
+    """
+    name = f"{block}_{reg}".lower()
+    const = f"{name.upper()}_ADDR"
+    if "options" in entries:
+        # Interconnect select registers have no sub-fields, the whole selection is one value
+        fields = [("value", "value", entries["mask"], entries["shift"])]
+    else:
+        # Unnamed fields (e.g. bit 31 of the UART CTRL registers) have no meaning to bind and are skipped
+        fields = [(field, arg_name(field), spec.mask, spec.shift)
+                  for field, spec in entries.items() if isinstance(spec, FieldSpec) and field]
+
+    args = ", ".join(f"{arg}=0" for _, arg, _, _ in fields)
+    encoded = " | ".join(f"(({arg} << {shift}) & {mask:#x})" if shift else f"({arg} & {mask:#x})"
+                         for _, arg, mask, shift in fields)
+    decoded = ", ".join(f'"{field}": (word & {mask:#x}) >> {shift}' if shift else f'"{field}": word & {mask:#x}'
+                        for field, _, mask, shift in fields)
+    call_args = ", ".join(arg for _, arg, _, _ in fields)
+
+    return [
+        f"{const} = {entries['addr']:#x}",
+        "",
+        "",
+        f"def encode_{name}({args}):",
+        f"    return {encoded}",
+        "",
+        "",
+        f"def set_{name}(sw, {args}):",
+        f"    sw.writeFPGARegister({const}, encode_{name}({call_args}))",
+        "",
+        "",
+        f"def decode_{name}(word):",
+        f"    return {{{decoded}}}",
+        "",
+        "",
+        f"def get_{name}(sw):",
+        f"    return decode_{name}(sw.readFPGARegister({const}))",
+        "",
+        "",
+    ]
+
+
+def main():
+    """
+        Generate the register bindings module
+    """
+    out = Path(sys.argv[1]) if len(sys.argv) > 1 else SCRIPTS_DIR / "fpga_regs_gen.py"
+    lines = [
+        '"""',
+        "Register bindings generated by tools/gen_regs.py from fpga_reg.py - do not edit",
+        '"""',
+        "",
+        "",
+    ]
+    for block, regs in REGISTERS.items():
+        for reg, entries in regs.items():
+            lines += gen_register(block, reg, entries)
+    out.write_text("\n".join(lines).rstrip("\n") + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()